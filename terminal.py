@@ -15,14 +15,17 @@ import atexit
 import logging
 import threading
 import json
-import shlex
+import marshal
 import signal
-import ast
 import re
+import bisect
+import errno
+import functools
+import stat
 from datetime import datetime
-import urllib.request
-import urllib.error
+from types import MappingProxyType
 import time as time_module
+from concurrent.futures import ThreadPoolExecutor
 
 
 SUPPORTED_DEBIAN_IDS = {
@@ -68,6 +71,8 @@ STATUS_BAR_COLORS = {
     'white': ('47', '30'),
     'black': ('40', '97'),
 }
+# Comma-separated color names for statusbar usage messages
+STATUS_BAR_COLOR_LIST = ', '.join(sorted(STATUS_BAR_COLORS))
 
 # Protected command names that plugins cannot override
 PROTECTED_COMMANDS = {
@@ -75,9 +80,77 @@ PROTECTED_COMMANDS = {
     'history', 'zps', 'zdtt', 'pip', 'python', 'python3', 'curl', 'wget'
 }
 
+# Bits returned by _parse_flags for rm/cp option clusters
+FLAG_RECURSIVE = 1
+FLAG_FORCE = 2
 
+# uname flags that map to a single os.uname() field
+UNAME_FLAG_FIELDS = {
+    '-s': 'sysname',
+    '-n': 'nodename',
+    '-r': 'release',
+    '-v': 'version',
+    '-m': 'machine',
+}
+
+# time command arguments mapped to the option they select
+TIME_FLAGS = {
+    '--24h': '24h', '-24': '24h', '24h': '24h',
+    '--12h': '12h', '-12': '12h', '12h': '12h',
+    '--help': 'help', '-h': 'help',
+    'iso': 'iso', 'full': 'full', 'date': 'date', 'clock': 'clock', 'unix': 'unix',
+}
+
+# Only quotes and backslashes make shlex.split differ from str.split
+SHLEX_SPECIAL_CHARS = frozenset('"\'\\')
+
+# Patterns containing none of these are plain strings to grep, so small files
+# can be searched in-process instead of spawning grep(1)
+GREP_META_CHARS = frozenset('.[]*^$\\+?{}|()\n')
+GREP_LITERAL_MAX_SIZE = 1 << 20
+# What grep --color=auto wraps each match in with the default GREP_COLORS
+GREP_MATCH_START = b'\x1b[01;31m\x1b[K'
+GREP_MATCH_END = b'\x1b[m\x1b[K'
+
+# Characters /bin/sh would interpret (quoting, expansion, redirection, job
+# control); commands without any of them are run directly, no shell needed
+SHELL_META_CHARS = frozenset('|&;<>()$`\\"\'*?[]#~{}!\n')
+
+# Shell messages that make the system command fallback hide its output
+COMMAND_NOT_FOUND_RE = re.compile(rb'command not found|not found:', re.IGNORECASE)
+# Seconds a fetched remote version is trusted before the update check refetches
+UPDATE_CHECK_TTL = 3600
+# Custom banner text by path: {path: ((mtime_ns, size, version), text)};
+# 'clear' redraws the banner, so the file is only re-read when it changes
+_BANNER_CACHE = {}
+# Builtins exposed to plugin code; each plugin gets its own copy
+PLUGIN_SAFE_BUILTINS = {
+    # Only allow safe builtins
+    'len': len, 'str': str, 'int': int, 'float': float,
+    'bool': bool, 'list': list, 'dict': dict, 'tuple': tuple,
+    'set': set, 'frozenset': frozenset, 'range': range,
+    'enumerate': enumerate, 'zip': zip, 'map': map, 'filter': filter,
+    'sorted': sorted, 'reversed': reversed, 'min': min, 'max': max,
+    'sum': sum, 'abs': abs, 'round': round, 'any': any, 'all': all,
+    'isinstance': isinstance, 'type': type, 'hasattr': hasattr,
+    'getattr': getattr, 'setattr': setattr, 'delattr': delattr,
+    'callable': callable, 'print': print, 'repr': repr,
+    # Exception classes (safe, required for normal Python code)
+    'BaseException': BaseException,
+    'Exception': Exception,
+    'ImportError': ImportError,
+    'NameError': NameError,
+    'ValueError': ValueError,
+    'TypeError': TypeError,
+    'RuntimeError': RuntimeError,
+}
+# Trusted plugins that use imports additionally get __import__
+PLUGIN_SAFE_BUILTINS_WITH_IMPORT = {**PLUGIN_SAFE_BUILTINS, '__import__': __import__}
+
+
+@functools.lru_cache(maxsize=None)
 def _parse_os_release():
-    """Return a dict of fields from /etc/os-release if available"""
+    """Return a read-only mapping of /etc/os-release fields (read once and shared)"""
     data = {}
     try:
         with open('/etc/os-release', 'r') as f:
@@ -90,7 +163,7 @@ def _parse_os_release():
                 data[key] = value
     except FileNotFoundError:
         pass
-    return data
+    return MappingProxyType(data)
 
 
 def _collect_tokens(*values):
@@ -111,16 +184,14 @@ def _collect_tokens(*values):
     return tokens
 
 
+@functools.lru_cache(maxsize=None)
 def _detect_supported_distro():
-    """Return distro identifier: 'debian', 'arch', or 'other'"""
+    """Return distro identifier: 'debian', 'arch', or 'other' (detected once per process)"""
+    # A stat per marker, stopping at the first hit; listing all of /etc
+    # would cost more than the two or three lookups this needs
     if os.path.exists('/etc/debian_version'):
         return 'debian'
-    
-    arch_markers = (
-        '/etc/arch-release',
-        '/etc/artix-release',
-    )
-    if any(os.path.exists(path) for path in arch_markers):
+    if os.path.exists('/etc/arch-release') or os.path.exists('/etc/artix-release'):
         return 'arch'
     
     os_release = _parse_os_release()
@@ -132,14 +203,175 @@ def _detect_supported_distro():
         return 'arch'
     
     # Fallback to package manager detection
-    if shutil.which('apt-get'):
+    if _which('apt-get'):
         return 'debian'
-    if shutil.which('pacman'):
+    if _which('pacman'):
         return 'arch'
     
     return 'other'
 
 
+# Found tools by (name, PATH). Misses aren't stored, so something installed
+# mid-session (pip after python3-pip, tools from 'update') is found next time
+_WHICH_CACHE = {}
+
+
+def _which(tool):
+    """Locate tool on PATH, reusing earlier hits while PATH is unchanged"""
+    key = (tool, os.environ.get('PATH', ''))
+    path = _WHICH_CACHE.get(key)
+    if path is None:
+        path = shutil.which(tool)
+        if path is not None:
+            _WHICH_CACHE[key] = path
+    return path
+
+
+def _forget_which(tool):
+    """Drop cached hits for tool, e.g. after its binary was removed or moved"""
+    for key in [key for key in _WHICH_CACHE if key[0] == tool]:
+        _WHICH_CACHE.pop(key, None)
+
+
+def _parse_flags(args):
+    """Split args into a FLAG_* bitmask and the remaining paths in one pass"""
+    flags = 0
+    paths = []
+    startswith = str.startswith  # Bound once; rm/cp can be handed thousands of args
+    for arg in args:
+        if startswith(arg, '-'):
+            # Only short option clusters (-r, -rf, -Rv) carry flag letters
+            if arg[:2] != '--':
+                if 'r' in arg or 'R' in arg:
+                    flags |= FLAG_RECURSIVE
+                if 'f' in arg:
+                    flags |= FLAG_FORCE
+        else:
+            paths.append(arg)
+    return flags, paths
+
+
+def _copy_file(src, dest):
+    """Copy a regular file like shutil.copy2, keeping the data in-kernel on Linux"""
+    if os.path.isdir(dest):
+        dest = os.path.join(dest, os.path.basename(src))
+    # Checked up front: SameFileError is an OSError, so the fallback below would swallow it
+    try:
+        same = os.path.samefile(src, dest)
+    except OSError:
+        same = False
+    if same:
+        raise shutil.SameFileError(f"'{src}' and '{dest}' are the same file")
+    if not hasattr(os, 'copy_file_range'):
+        return shutil.copy2(src, dest)
+    
+    try:
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            # Files reporting size 0 (/proc, /sys) generate their data on read,
+            # which copy_file_range doesn't see; copy2 reads them properly
+            if os.fstat(src_fd).st_size == 0:
+                return shutil.copy2(src, dest)
+            dst_fd = os.open(dest, os.O_WRONLY | os.O_CREAT, 0o644)
+            try:
+                os.ftruncate(dst_fd, 0)
+                copied = os.copy_file_range(src_fd, dst_fd, 1 << 30)
+                while copied and os.copy_file_range(src_fd, dst_fd, 1 << 30):
+                    pass
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    except OSError:
+        # Cross-device copies on older kernels, unsupported filesystems, etc.
+        return shutil.copy2(src, dest)
+    if not copied:
+        # Nothing moved in-kernel although the file isn't empty
+        return shutil.copy2(src, dest)
+    
+    shutil.copystat(src, dest)
+    return dest
+
+
+def _splice_all(src_fd, dst_fd):
+    """Move everything left in src_fd to dst_fd in-kernel; False if splice is unusable"""
+    try:
+        while os.splice(src_fd, dst_fd, 1 << 16):
+            pass
+    except OSError as e:
+        # Neither end supports splicing (e.g. a tty on newer kernels)
+        if e.errno in (errno.EINVAL, errno.ENOSYS):
+            return False
+        raise
+    return True
+
+
+def _count_entries(path):
+    """Count every entry below path without following symlinks"""
+    stack = [path]
+    count = 0
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                count += 1
+                # DirEntry caches the d_type from getdents, so no extra stat here
+                if entry.is_dir(follow_symlinks=False) and not entry.is_symlink():
+                    stack.append(entry.path)
+    return count
+
+
+def _literal_command_names(func):
+    """Return the keys of a register_commands() that only returns a dict literal.
+
+    Returns None when the command names cannot be known without running it.
+    """
+    import ast
+
+    if not isinstance(func, ast.FunctionDef) or func.decorator_list:
+        return None
+    body = func.body
+    if (body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant)
+            and isinstance(body[0].value.value, str)):
+        body = body[1:]
+    if len(body) != 1 or not isinstance(body[0], ast.Return) or not isinstance(body[0].value, ast.Dict):
+        return None
+    names = []
+    for key in body[0].value.keys:
+        # A None key is a **mapping unpack
+        if not (isinstance(key, ast.Constant) and isinstance(key.value, str)):
+            return None
+        names.append(key.value)
+    return list(dict.fromkeys(names))
+
+
+def _https_get(host, path, timeout=2):
+    """Fetch https://host/path with a bare HTTP/1.0 request and return the body bytes.
+
+    Raises OSError on connection problems or a non-200 response. Redirects are not followed.
+    """
+    # Only needed by the background update check, so keep them off the startup path
+    import socket
+    import ssl
+
+    context = ssl.create_default_context()
+    request = f"GET {path} HTTP/1.0\r\nHost: {host}\r\nConnection: close\r\n\r\n"
+    chunks = []
+    with socket.create_connection((host, 443), timeout=timeout) as sock:
+        with context.wrap_socket(sock, server_hostname=host) as tls:
+            tls.sendall(request.encode('ascii'))
+            while True:
+                chunk = tls.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    head, _, body = b''.join(chunks).partition(b'\r\n\r\n')
+    status_line = head.split(b'\r\n', 1)[0]
+    parts = status_line.split(None, 2)
+    if len(parts) < 2 or parts[1] != b'200':
+        raise OSError(f"unexpected response: {status_line.decode('latin-1')}")
+    return body
+
+
 def _prompt_distro_override(detected_distro):
     """Allow user to override detected distro."""
     label_map = {
@@ -163,16 +395,21 @@ def _prompt_distro_override(detected_distro):
     return detected_distro
 
 
+def _read_json_file(path):
+    """Parse a JSON file from one binary read (json.loads decodes UTF-8 itself)"""
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
 def _load_saved_distro():
     """Load saved distro preference from config file."""
     config_file = os.path.expanduser("~/.zdtt/config.json")
     try:
-        with open(config_file, 'r') as f:
-            data = json.load(f)
-            saved_distro = data.get('distro')
-            if saved_distro in ('debian', 'arch', 'mac', 'other'):
-                return saved_distro
-    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        data = _read_json_file(config_file)
+        saved_distro = data.get('distro')
+        if saved_distro in ('debian', 'arch', 'mac', 'other'):
+            return saved_distro
+    except (FileNotFoundError, ValueError, KeyError):
         pass
     return None
 
@@ -183,15 +420,14 @@ def _save_distro_preference(distro):
     
     data = {}
     try:
-        with open(config_file, 'r') as f:
-            data = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        data = _read_json_file(config_file)
+    except (FileNotFoundError, ValueError):
         data = {}
     
     data['distro'] = distro
     
     with open(config_file, 'w') as f:
-        json.dump(data, f, indent=2)
+        f.write(json.dumps(data, indent=2))
 
 def check_system_compatibility():
     """Detect supported platforms/distributions and warn when unsupported."""
@@ -209,7 +445,7 @@ def check_system_compatibility():
         print("=" * 60)
         
         # Check for Homebrew
-        brew_path = shutil.which('brew')
+        brew_path = _which('brew')
         if not brew_path:
             # Check common Homebrew locations
             for path in ('/opt/homebrew/bin/brew', '/usr/local/bin/brew'):
@@ -330,7 +566,76 @@ def check_system_compatibility():
 
 
 class ZDTTTerminal:
-    def __init__(self, distro='debian'):
+    # Fixed attribute set: no per-instance __dict__, slot access for hot paths.
+    # Any new instance attribute must be listed here.
+    __slots__ = (
+        'username', 'running', 'current_dir', 'distro',
+        'is_debian', 'is_arch', 'is_mac', 'is_supported', 'enable_status_bar',
+        'zdtt_dir', 'history_file', 'plugin_dir', 'quarantine_dir', 'plugin_cache_dir',
+        'log_file', 'banner_file', 'aliases_file', 'config_file', 'update_cache_file',
+        '_prefs_cache', 'status_bar_color', '_status_bar_colors_cache', '_status_bar_text_cache',
+        'status_bar_active', '_at_prompt', 'scroll_region_set', 'resize_lock',
+        'commands', 'aliases', 'plugin_command_names', '_pending_plugins',
+        '_plugins_ready', '_prepared_plugins', '_plugin_thread',
+        'safe_mode', 'quarantine_warnings', 'trusted_plugins',
+        'update_check_thread', '_io_pool', 'version',
+        '_sysfetch_bin', '_prompt_cache', '_prompt_head', '_prompt_tail', '_home', '_is_root',
+        '_completion_names', '_completion_matches', '_history_baseline', '_help_text', '_alias_text',
+    )
+    
+    # ANSI color codes - Enhanced palette (shared by all instances)
+    COLOR_RESET = '\033[0m'
+    COLOR_BOLD = '\033[1m'
+    COLOR_DIM = '\033[2m'
+    COLOR_ITALIC = '\033[3m'
+    
+    # Standard colors
+    COLOR_BLACK = '\033[30m'
+    COLOR_RED = '\033[31m'
+    COLOR_GREEN = '\033[32m'
+    COLOR_YELLOW = '\033[33m'
+    COLOR_BLUE = '\033[34m'
+    COLOR_MAGENTA = '\033[35m'
+    COLOR_CYAN = '\033[36m'
+    COLOR_WHITE = '\033[37m'
+    
+    # Bright colors
+    COLOR_BRIGHT_BLACK = '\033[90m'
+    COLOR_BRIGHT_RED = '\033[91m'
+    COLOR_BRIGHT_GREEN = '\033[92m'
+    COLOR_BRIGHT_YELLOW = '\033[93m'
+    COLOR_BRIGHT_BLUE = '\033[94m'
+    COLOR_BRIGHT_MAGENTA = '\033[95m'
+    COLOR_BRIGHT_CYAN = '\033[96m'
+    COLOR_BRIGHT_WHITE = '\033[97m'
+    
+    # Accent colors (using bright variants for better visibility)
+    COLOR_ACCENT = '\033[96m'  # Bright cyan
+    COLOR_ACCENT2 = '\033[94m'  # Bright blue
+    COLOR_SUCCESS = '\033[92m'  # Bright green
+    COLOR_WARNING = '\033[93m'  # Bright yellow
+    COLOR_ERROR = '\033[91m'    # Bright red
+    COLOR_INFO = '\033[96m'      # Bright cyan
+    
+    # Background colors
+    BG_BLACK = '\033[40m'
+    BG_RED = '\033[41m'
+    BG_GREEN = '\033[42m'
+    BG_YELLOW = '\033[43m'
+    BG_BLUE = '\033[44m'
+    BG_MAGENTA = '\033[45m'
+    BG_CYAN = '\033[46m'
+    BG_WHITE = '\033[47m'
+    BG_BRIGHT_CYAN = '\033[106m'
+    
+    # Box drawn at the top of 'about', formatted once when the class is created
+    ABOUT_HEADER = (
+        f"{COLOR_BRIGHT_CYAN}{COLOR_BOLD}╔═══════════════════════════════════════════════════════════╗{COLOR_RESET}\n"
+        f"{COLOR_BRIGHT_CYAN}{COLOR_BOLD}║{COLOR_RESET}  {COLOR_BRIGHT_CYAN}{COLOR_BOLD}About ZDTT Terminal{COLOR_RESET}                                        {COLOR_BRIGHT_CYAN}{COLOR_BOLD}║{COLOR_RESET}\n"
+        f"{COLOR_BRIGHT_CYAN}{COLOR_BOLD}╚═══════════════════════════════════════════════════════════╝{COLOR_RESET}"
+    )
+    
+    def __init__(self, distro='debian', safe_mode=False):
         self.username = getpass.getuser()
         self.running = True
         self.current_dir = os.getcwd()
@@ -345,26 +650,45 @@ class ZDTTTerminal:
         self.history_file = os.path.expanduser("~/.zdtt_history")
         self.plugin_dir = os.path.join(self.zdtt_dir, "plugins")
         self.quarantine_dir = os.path.join(self.zdtt_dir, "quarantine")
+        self.plugin_cache_dir = os.path.join(self.zdtt_dir, "plugin_cache")
         self.log_file = os.path.join(self.zdtt_dir, "plugin_errors.log")
         self.banner_file = os.path.join(self.zdtt_dir, "banner.txt")
         self.aliases_file = os.path.join(self.zdtt_dir, "aliases")
         self.config_file = os.path.join(self.zdtt_dir, "config.json")
+        self.update_cache_file = os.path.join(self.zdtt_dir, "update_cache.json")
+        self._prefs_cache = {}  # Full config.json contents, kept so saves need no re-read
         self.status_bar_color = 'blue'
-        self.status_bar_thread = None
-        self.status_bar_stop_event = threading.Event()
+        self.status_bar_active = False  # True while the minute timer keeps the bar fresh
+        self._at_prompt = False  # True only while input() waits for a command line
         self.scroll_region_set = False
         self.plugin_command_names = set()
+        self._pending_plugins = {}  # Validated plugins not executed until first use
         self.update_check_thread = None
+        # Shared pool for I/O-bound helpers; workers start on first submit
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=(os.cpu_count() or 4) * 2,
+            thread_name_prefix='zdtt-io',
+        )
         self.resize_lock = threading.Lock()  # Lock for resize operations
-        self.safe_mode = False  # Safe mode flag (no plugins loaded)
+        self.safe_mode = safe_mode  # Safe mode flag (no plugins loaded)
         self.quarantine_warnings = []  # Store warnings for plugins quarantined at startup
         self.trusted_plugins = set()  # Plugins allowed to use imports
+        self._sysfetch_bin = None  # Resolved fetch tool, reused across sysfetch calls
+        self._prompt_cache = None  # (cwd, prompt) from the last get_prompt call
+        self._home = os.path.expanduser("~")
+        self._build_prompt_parts()  # Everything in the prompt but the path
+        self._help_text = None  # Formatted on the first 'help'
+        geteuid = getattr(os, 'geteuid', None)
+        self._is_root = geteuid is not None and geteuid() == 0
         
         # Setup logging for plugins
         self.setup_logging()
         
         # Load user aliases
         self.aliases = {}
+        self._alias_text = None  # Rendered 'alias' listing; None when stale
+        self._completion_names = None  # Sorted command + alias names; None when stale
+        self._completion_matches = None  # Matches computed at state 0 of a TAB press
         self.load_aliases()
         
         # Read version from version.txt
@@ -372,51 +696,8 @@ class ZDTTTerminal:
         
         # Load user preferences (status bar color, etc.)
         self.load_preferences()
-        
-        # ANSI color codes - Enhanced palette
-        self.COLOR_RESET = '\033[0m'
-        self.COLOR_BOLD = '\033[1m'
-        self.COLOR_DIM = '\033[2m'
-        self.COLOR_ITALIC = '\033[3m'
-        
-        # Standard colors
-        self.COLOR_BLACK = '\033[30m'
-        self.COLOR_RED = '\033[31m'
-        self.COLOR_GREEN = '\033[32m'
-        self.COLOR_YELLOW = '\033[33m'
-        self.COLOR_BLUE = '\033[34m'
-        self.COLOR_MAGENTA = '\033[35m'
-        self.COLOR_CYAN = '\033[36m'
-        self.COLOR_WHITE = '\033[37m'
-        
-        # Bright colors
-        self.COLOR_BRIGHT_BLACK = '\033[90m'
-        self.COLOR_BRIGHT_RED = '\033[91m'
-        self.COLOR_BRIGHT_GREEN = '\033[92m'
-        self.COLOR_BRIGHT_YELLOW = '\033[93m'
-        self.COLOR_BRIGHT_BLUE = '\033[94m'
-        self.COLOR_BRIGHT_MAGENTA = '\033[95m'
-        self.COLOR_BRIGHT_CYAN = '\033[96m'
-        self.COLOR_BRIGHT_WHITE = '\033[97m'
-        
-        # Accent colors (using bright variants for better visibility)
-        self.COLOR_ACCENT = '\033[96m'  # Bright cyan
-        self.COLOR_ACCENT2 = '\033[94m'  # Bright blue
-        self.COLOR_SUCCESS = '\033[92m'  # Bright green
-        self.COLOR_WARNING = '\033[93m'  # Bright yellow
-        self.COLOR_ERROR = '\033[91m'    # Bright red
-        self.COLOR_INFO = '\033[96m'      # Bright cyan
-        
-        # Background colors
-        self.BG_BLACK = '\033[40m'
-        self.BG_RED = '\033[41m'
-        self.BG_GREEN = '\033[42m'
-        self.BG_YELLOW = '\033[43m'
-        self.BG_BLUE = '\033[44m'
-        self.BG_MAGENTA = '\033[45m'
-        self.BG_CYAN = '\033[46m'
-        self.BG_WHITE = '\033[47m'
-        self.BG_BRIGHT_CYAN = '\033[106m'
+        self._set_status_bar_color(self.status_bar_color)
+        self._status_bar_text_cache = None  # (key, text) of the last rendered bar
         
         self.commands = {
             'help': self.cmd_help,
@@ -459,9 +740,14 @@ class ZDTTTerminal:
         # Setup readline history and tab completion
         self.setup_readline()
         
-        # Load plugins (unless in safe mode)
+        # Read and validate plugins in the background (unless in safe mode);
+        # registration happens on the main thread once the banner is up
+        self._plugins_ready = threading.Event()
+        self._prepared_plugins = None
+        self._plugin_thread = None
         if not self.safe_mode:
-            self.load_plugins()
+            self._plugin_thread = threading.Thread(target=self._prepare_plugins_bg, daemon=True)
+            self._plugin_thread.start()
         
         # Kick off async update check
         self.start_update_check()
@@ -500,8 +786,9 @@ class ZDTTTerminal:
     def load_preferences(self):
         """Load user preferences such as status bar color and distro."""
         try:
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
+            data = _read_json_file(self.config_file)
+            if isinstance(data, dict):
+                self._prefs_cache = data
             self.status_bar_color = data.get('status_bar_color', self.status_bar_color)
             # Trusted plugins that are allowed to use imports
             trusted = data.get('trusted_plugins', [])
@@ -510,25 +797,23 @@ class ZDTTTerminal:
             # Note: distro is loaded in check_system_compatibility before terminal init
         except FileNotFoundError:
             pass
-        except json.JSONDecodeError:
+        except ValueError:  # JSONDecodeError, or bytes that aren't UTF-8
             logging.warning("Preferences file is corrupted; using defaults.")
     
     def save_preferences(self):
         """Persist user preferences."""
-        data = {}
-        try:
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            data = {}
-        
+        # Other keys (e.g. distro) were read at startup and are written back unchanged
+        data = self._prefs_cache
         data['status_bar_color'] = self.status_bar_color
         # Persist trusted plugins as a sorted list for readability
         data['trusted_plugins'] = sorted(self.trusted_plugins)
         # Note: distro is saved in check_system_compatibility
         
-        with open(self.config_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Write to a temp file and rename so a crash never leaves a truncated config
+        tmp_file = self.config_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            f.write(json.dumps(data, indent=2))
+        os.replace(tmp_file, self.config_file)
     
     def start_update_check(self):
         """Start the background thread that checks for updates."""
@@ -544,10 +829,12 @@ class ZDTTTerminal:
     def _check_for_updates(self):
         """Background worker that checks if a new version is available."""
         try:
-            # Get remote version
-            url = "https://zdtt-sources.zane.org/version.txt"
-            with urllib.request.urlopen(url, timeout=2) as response:
-                remote_version = response.read().decode('utf-8').strip()
+            # Get remote version, from the cache if it was fetched recently
+            remote_version = self._load_cached_remote_version()
+            if remote_version is None:
+                body = _https_get("zdtt-sources.zane.org", "/version.txt", timeout=2)
+                remote_version = body.decode('utf-8').strip()
+                self._store_cached_remote_version(remote_version)
             
             # Compare versions
             if remote_version != self.version:
@@ -559,6 +846,28 @@ class ZDTTTerminal:
             # Silently fail if we can't check for updates
             pass
     
+    def _load_cached_remote_version(self):
+        """Return the last fetched remote version if it is still fresh, else None."""
+        try:
+            data = _read_json_file(self.update_cache_file)
+            age = time_module.time() - data['checked_at']
+            remote_version = data['remote_version']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if 0 <= age < UPDATE_CHECK_TTL and isinstance(remote_version, str):
+            return remote_version
+        return None
+    
+    def _store_cached_remote_version(self, remote_version):
+        """Remember the fetched remote version so the next launches skip the network."""
+        tmp_file = self.update_cache_file + ".tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump({'remote_version': remote_version, 'checked_at': time_module.time()}, f)
+            os.replace(tmp_file, self.update_cache_file)
+        except OSError as e:
+            logging.error(f"Failed to cache update check: {e}")
+    
     def display_banner(self):
         """Display the ZDTT ASCII art banner (or custom banner if available)"""
         print()
@@ -583,18 +892,28 @@ class ZDTTTerminal:
             pass
         
         # Check for custom banner
-        if os.path.exists(self.banner_file):
+        try:
+            st = os.stat(self.banner_file)
+        except OSError:
+            st = None
+        if st is not None:
             try:
-                with open(self.banner_file, 'r') as f:
-                    custom_banner = f.read()
+                key = (st.st_mtime_ns, st.st_size, self.version)
+                cached = _BANNER_CACHE.get(self.banner_file)
+                if cached is not None and cached[0] == key:
+                    custom_banner = cached[1]
+                else:
+                    with open(self.banner_file, 'r') as f:
+                        custom_banner = f.read()
                     # Add version at the bottom if not already present
                     if '{version}' in custom_banner:
                         custom_banner = custom_banner.replace('{version}', self.version)
-                    print(custom_banner)
-                    # Show warning for unsupported systems
-                    if not self.is_supported:
-                        self._show_compatibility_warning()
-                    return
+                    _BANNER_CACHE[self.banner_file] = (key, custom_banner)
+                print(custom_banner)
+                # Show warning for unsupported systems
+                if not self.is_supported:
+                    self._show_compatibility_warning()
+                return
             except Exception as e:
                 logging.error(f"Failed to load custom banner: {e}")
                 # Fall through to default banner
@@ -628,73 +947,88 @@ ZDTT Terminal v{self.version}
         print("    Tested on Debian-based and Arch Linux distributions.")
         print()
     
+    def _set_status_bar_color(self, color):
+        """Set the status bar color and the (bg, fg) codes the renderer reads."""
+        self.status_bar_color = color
+        # Resolved once per change rather than on every render
+        self._status_bar_colors_cache = STATUS_BAR_COLORS.get(color, ('44', '97'))
+    
     def initialize_status_bar(self):
-        """Reserve the first terminal row and start the status bar thread."""
+        """Reserve the first terminal row and start the status bar timer."""
         if not self.enable_status_bar:
             return  # Skip status bar on macOS
         self._set_scroll_region()
-        self._start_status_bar_thread()
+        self._start_status_bar_timer()
         self._render_status_bar()
     
     def shutdown_status_bar(self):
-        """Stop the status bar thread and release terminal state."""
+        """Stop the status bar timer and release terminal state."""
         if not self.enable_status_bar:
             return  # Skip status bar on macOS
-        self.status_bar_stop_event.set()
-        if self.status_bar_thread and self.status_bar_thread.is_alive():
-            self.status_bar_thread.join(timeout=0.5)
-        self.status_bar_thread = None
+        if self.status_bar_active:
+            self.status_bar_active = False
+            signal.setitimer(signal.ITIMER_REAL, 0)
         self._reset_scroll_region()
     
-    def _start_status_bar_thread(self):
+    def _start_status_bar_timer(self):
+        """Redraw the bar from SIGALRM as each minute starts, instead of polling."""
         if not self.enable_status_bar:
             return  # Skip status bar on macOS
-        if self.status_bar_thread and self.status_bar_thread.is_alive():
+        if self.status_bar_active or not hasattr(signal, 'setitimer'):
             return
-        self.status_bar_stop_event.clear()
-        self.status_bar_thread = threading.Thread(
-            target=self._status_bar_loop,
-            name="ZDTTStatusBar",
-            daemon=True,
-        )
-        self.status_bar_thread.start()
+        try:
+            signal.signal(signal.SIGALRM, self._status_bar_tick)
+        except ValueError:
+            return  # Signal handlers can only be installed from the main thread
+        self.status_bar_active = True
+        self._schedule_status_bar_tick()
+    
+    def _schedule_status_bar_tick(self):
+        # The bar shows hours and minutes, so the next change is at :00.
+        # Re-armed from each tick rather than as an interval so it can't drift.
+        delay = 60.0 - time_module.time() % 60.0 + 0.01
+        signal.setitimer(signal.ITIMER_REAL, delay)
+    
+    def _status_bar_tick(self, signum=None, frame=None):
+        """Handle SIGALRM: redraw the status bar for the new minute."""
+        if not self.status_bar_active:
+            return
+        self._schedule_status_bar_tick()
+        # Only touch the terminal while idle at the prompt, and bypass the
+        # sys.stdout buffer so a write the main thread was in the middle of
+        # can't be interleaved or re-entered. A command that is running when
+        # the minute changes gets the bar redrawn by run() once it returns.
+        if not self._at_prompt:
+            return
+        try:
+            os.write(sys.stdout.fileno(), self._status_bar_sequence().encode())
+        except Exception:
+            pass
     
-    def _status_bar_loop(self):
-        while not self.status_bar_stop_event.is_set():
-            self._render_status_bar()
-            if self.status_bar_stop_event.wait(2):
-                break
+    def _status_bar_sequence(self):
+        """Build the escape sequence that draws the status bar on row 1."""
+        # Get terminal size first to ensure we don't write beyond bounds
+        try:
+            term_size = shutil.get_terminal_size()
+            max_width = term_size.columns
+        except Exception:
+            max_width = 80  # Fallback
+        
+        # Already width-checked (with a plain-text fallback) by the builder
+        bar_text = self._build_status_bar_text()
+        
+        # One write per redraw:
+        #   save cursor, move to row 1 col 1, clear the line, reset attributes,
+        #   bar, reset again, move to column max_width (prevents wrapping
+        #   issues), restore cursor
+        return f"\033[s\033[1;1H\033[2K\033[0m{bar_text}\033[0m\033[{max_width}G\033[u"
     
     def _render_status_bar(self):
         """Render a single-line status bar with branding and time."""
         if not self.enable_status_bar:
             return  # Skip status bar on macOS
         try:
-            # Get terminal size first to ensure we don't write beyond bounds
-            try:
-                term_size = shutil.get_terminal_size()
-                max_width = term_size.columns
-            except Exception:
-                max_width = 80  # Fallback
-            
-            bar_text = self._build_status_bar_text()
-            
-            # Ensure bar_text doesn't exceed terminal width (safety check)
-            # Count visible characters (approximate - ANSI codes don't count)
-            # This is a rough check, but better than nothing
-            if len(bar_text) > max_width * 3:  # Allow for ANSI codes (rough estimate)
-                # Rebuild with safer width
-                bar_text = self._build_status_bar_text()
-            
-            sys.stdout.write("\033[s")          # Save cursor position
-            sys.stdout.write("\033[1;1H")       # Move to first row, first column
-            sys.stdout.write("\033[2K")         # Clear the entire line
-            sys.stdout.write("\033[0m")         # Reset all attributes
-            sys.stdout.write(bar_text)
-            sys.stdout.write("\033[0m")         # Ensure reset at end
-            # Move cursor to end of line to prevent wrapping issues
-            sys.stdout.write(f"\033[{max_width}G")  # Move to column max_width
-            sys.stdout.write("\033[u")          # Restore cursor
+            sys.stdout.write(self._status_bar_sequence())
             sys.stdout.flush()
         except Exception:
             # Fallback: just skip rendering if there's an error
@@ -702,7 +1036,6 @@ ZDTT Terminal v{self.version}
     
     def _build_status_bar_text(self):
         """Render a single-line status bar with enhanced branding and time."""
-        left_text = f"{self.COLOR_BOLD}ZDTT{self.COLOR_RESET} by {self.COLOR_BOLD}ZaneDev{self.COLOR_RESET}"
         time_str = datetime.now().strftime("%I:%M %p")
         plain_left = "ZDTT by ZaneDev"
         plain_time = time_str
@@ -717,6 +1050,16 @@ ZDTT Terminal v{self.version}
             # Fallback to minimum width if we can't get terminal size
             width = max(1, len(plain_left) + len(plain_time) + 6)
         
+        # The bar only changes with the width, the minute and the colors,
+        # but run() redraws it after every command (and clear, resize and
+        # color changes redraw it too), mostly within the same minute
+        key = (width, time_str, self._status_bar_colors_cache)
+        cached = self._status_bar_text_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        left_text = f"{self.COLOR_BOLD}ZDTT{self.COLOR_RESET} by {self.COLOR_BOLD}ZaneDev{self.COLOR_RESET}"
+        
         # Calculate the minimum content width (plain text only, no ANSI codes)
         # Format: " ZDTT by ZaneDev | TIME "
         min_content_width = len(plain_left) + len(plain_time) + 5  # 5 = spaces + separator
@@ -757,7 +1100,7 @@ ZDTT Terminal v{self.version}
         
         # Final safety check: ensure we never exceed terminal width
         # This is approximate since ANSI codes don't count, but better than nothing
-        bg_code, fg_code = STATUS_BAR_COLORS.get(self.status_bar_color, ('44', '97'))
+        bg_code, fg_code = self._status_bar_colors_cache
         result = f"\033[{bg_code}m\033[{fg_code}m{bar_content}\033[0m"
         
         # If the result is suspiciously long, truncate it
@@ -768,6 +1111,7 @@ ZDTT Terminal v{self.version}
             simple_bar = simple_bar[:width] if len(simple_bar) > width else simple_bar.ljust(width)
             result = f"\033[{bg_code}m\033[{fg_code}m{simple_bar}\033[0m"
         
+        self._status_bar_text_cache = (key, result)
         return result
     
     def _set_scroll_region(self):
@@ -775,10 +1119,8 @@ ZDTT Terminal v{self.version}
         try:
             rows = shutil.get_terminal_size().lines
             rows = max(rows, 2)
-            sys.stdout.write(f"\033[2;{rows}r")
-            sys.stdout.write("\033[1;1H")
-            sys.stdout.write("\033[2K")
-            sys.stdout.write("\033[2;1H")
+            # Scroll rows 2..rows, blank row 1, park the cursor on row 2
+            sys.stdout.write(f"\033[2;{rows}r\033[1;1H\033[2K\033[2;1H")
             sys.stdout.flush()
             self.scroll_region_set = True
         except Exception:
@@ -814,9 +1156,8 @@ ZDTT Terminal v{self.version}
             
             # Clear the status bar line completely before redrawing
             try:
-                sys.stdout.write("\033[1;1H")       # Move to first row
-                sys.stdout.write("\033[2K")         # Clear the entire line
-                sys.stdout.write("\033[0m")       # Reset attributes
+                # Move to first row, clear the entire line, reset attributes
+                sys.stdout.write("\033[1;1H\033[2K\033[0m")
                 sys.stdout.flush()
             except Exception:
                 pass
@@ -838,6 +1179,19 @@ ZDTT Terminal v{self.version}
         finally:
             self.resize_lock.release()
     
+    def _save_history(self):
+        """Write this session's history on exit, appending only new entries when possible."""
+        length = readline.get_current_history_length()
+        # Once the in-memory history is full, old entries have been dropped and the
+        # length no longer tells what is new; a full rewrite also trims the file
+        if (hasattr(readline, 'append_history_file') and length < readline.get_history_length()
+                and os.path.exists(self.history_file)):
+            new_entries = length - self._history_baseline
+            if new_entries > 0:
+                readline.append_history_file(new_entries, self.history_file)
+        else:
+            readline.write_history_file(self.history_file)
+    
     def setup_readline(self):
         """Setup readline for history and tab completion"""
         # Setup history
@@ -848,9 +1202,11 @@ ZDTT Terminal v{self.version}
         
         # Set history length
         readline.set_history_length(1000)
+        # Entries already on disk; only ones added after this need saving
+        self._history_baseline = readline.get_current_history_length()
         
         # Save history on exit
-        atexit.register(readline.write_history_file, self.history_file)
+        atexit.register(self._save_history)
         
         # Setup tab completion
         readline.set_completer(self.complete)
@@ -861,6 +1217,19 @@ ZDTT Terminal v{self.version}
     
     def complete(self, text, state):
         """Tab completion function"""
+        # readline calls this once per candidate with increasing state;
+        # only search on the first call and serve the rest from that result
+        if state == 0 or self._completion_matches is None:
+            self._completion_matches = self._completion_options(text)
+        options = self._completion_matches
+        
+        # Return the state-th option
+        if state < len(options):
+            return options[state]
+        return None
+    
+    def _completion_options(self, text):
+        """Compute all completion candidates for text."""
         # Get all possible completions
         options = []
         
@@ -870,9 +1239,7 @@ ZDTT Terminal v{self.version}
         # If we're at the start or completing a command
         if line.startswith(text) or ' ' not in line[:readline.get_begidx()]:
             # Complete command names (built-in commands and aliases)
-            options = [cmd for cmd in self.commands.keys() if cmd.startswith(text)]
-            # Add aliases
-            options.extend([alias for alias in self.aliases.keys() if alias.startswith(text)])
+            options = self._complete_command_names(text)
         else:
             # Complete filenames/directories
             if text.startswith('~'):
@@ -890,16 +1257,32 @@ ZDTT Terminal v{self.version}
             except:
                 options = []
         
-        # Return the state-th option
-        if state < len(options):
-            return options[state]
-        return None
+        return options
+    
+    def _complete_command_names(self, text):
+        """Return command and alias names starting with text."""
+        names = self._completion_names
+        if names is None:
+            names = self._completion_names = sorted(self.commands.keys() | self.aliases.keys())
+        # Everything with the prefix sorts between text and text + the highest code point
+        lo = bisect.bisect_left(names, text)
+        hi = bisect.bisect_left(names, text + '\U0010ffff', lo)
+        return names[lo:hi]
+    
+    def _invalidate_completions(self):
+        """Mark the completion name list stale after commands or aliases change."""
+        self._completion_names = None
     
     def _validate_plugin_ast(self, plugin_code, plugin_name):
         """
         Validate plugin AST to ensure no top-level code execution.
         Only allows: imports, function definitions, class definitions, and docstrings.
+        Returns (tree, uses_imports, command_names); command_names is None unless
+        register_commands() simply returns a dict literal.
         """
+        # Imported here: only plugin loading needs it, and that runs in the background
+        import ast
+
         try:
             tree = ast.parse(plugin_code)
         except SyntaxError as e:
@@ -909,26 +1292,32 @@ ZDTT Terminal v{self.version}
         if not isinstance(tree, ast.Module):
             raise ValueError("Plugin must be a valid Python module")
         
+        # Node-type tuples built once rather than per statement/node
+        import_types = (ast.Import, ast.ImportFrom)
+        function_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+        uses_imports = False
+        command_names = None
         for stmt in tree.body:
             # Allow imports
-            if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            if isinstance(stmt, import_types):
+                uses_imports = True
+                if any((alias.asname or alias.name) == 'register_commands' for alias in stmt.names):
+                    command_names = None
                 continue
             # Allow function definitions
-            if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if isinstance(stmt, function_types):
+                if stmt.name == 'register_commands':
+                    command_names = _literal_command_names(stmt)
                 continue
             # Allow class definitions
             if isinstance(stmt, ast.ClassDef):
+                if stmt.name == 'register_commands':
+                    command_names = None
                 continue
             # Allow docstrings (Expr with string constant)
-            if isinstance(stmt, ast.Expr):
-                # Check if it's a string literal (docstring)
-                if isinstance(stmt.value, (ast.Constant, ast.Str)):
-                    # For Python 3.8+, use ast.Constant; for older versions, use ast.Str
-                    if isinstance(stmt.value, ast.Constant):
-                        if isinstance(stmt.value.value, str):
-                            continue
-                    elif isinstance(stmt.value, ast.Str):
-                        continue
+            if (isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant)
+                    and isinstance(stmt.value.value, str)):
+                continue
             # Anything else is forbidden (assignments, function calls, loops, etc.)
             raise ValueError(
                 f"Plugin contains forbidden top-level statement: {stmt.__class__.__name__}. "
@@ -936,7 +1325,12 @@ ZDTT Terminal v{self.version}
                 "No top-level code execution is allowed."
             )
         
-        return True
+        # Imports nested inside functions or classes also require trust
+        if not uses_imports:
+            uses_imports = any(
+                isinstance(node, import_types) for node in ast.walk(tree)
+            )
+        return tree, uses_imports, command_names
     
     def _move_to_quarantine(self, plugin_file, reason):
         """Move a plugin file to quarantine directory and log the reason."""
@@ -962,14 +1356,12 @@ ZDTT Terminal v{self.version}
     
     def _validate_plugin_commands(self, plugin_commands, plugin_name):
         """Validate that plugin commands don't override protected commands."""
-        violations = []
-        for cmd_name in plugin_commands.keys():
-            if cmd_name in PROTECTED_COMMANDS:
-                violations.append(cmd_name)
+        # dict_keys & set intersects in C; sorted so the message is stable
+        violations = plugin_commands.keys() & PROTECTED_COMMANDS
         
         if violations:
             raise ValueError(
-                f"Plugin attempted to override protected commands: {', '.join(violations)}. "
+                f"Plugin attempted to override protected commands: {', '.join(sorted(violations))}. "
                 "This is a security violation and the plugin has been quarantined."
             )
         
@@ -985,56 +1377,123 @@ ZDTT Terminal v{self.version}
     
     def load_plugins(self):
         """Load plugin commands from the plugins directory with security validation."""
-        if not os.path.exists(self.plugin_dir):
+        self._register_plugins(self._prepare_plugins())
+    
+    def _prepare_plugins(self):
+        """
+        Read, validate and compile plugin files without executing them.
+        Nothing here prompts or touches self.commands, so it can run off the
+        main thread. Returns (status, plugin_file, plugin_name, detail) tuples.
+        """
+        # Look for Python files in the plugins directory (same matches as glob "*.py");
+        # the quarantine directory is created by _move_to_quarantine when first needed
+        try:
+            with os.scandir(self.plugin_dir) as it:
+                plugin_entries = [
+                    entry for entry in it
+                    if entry.name.endswith('.py') and not entry.name.startswith('.') and entry.is_file()
+                ]
+        except FileNotFoundError:
             os.makedirs(self.plugin_dir, exist_ok=True)
-            return
+            return []
+        if not plugin_entries:
+            return []
+        # Load in name order so overrides and warnings don't depend on directory order
+        plugin_entries.sort(key=lambda entry: entry.name)
+        
+        # Files whose stat signature matches the index skip the read and hash
+        index = self._load_plugin_index()
+        prepare = functools.partial(self._prepare_plugin_file, index=index)
+        # Reads of separate files overlap on the shared I/O pool; map keeps name order
+        if len(plugin_entries) > 1:
+            results = list(self._io_pool.map(prepare, plugin_entries))
+        else:
+            results = [prepare(entry) for entry in plugin_entries]
         
-        # Ensure quarantine directory exists
-        os.makedirs(self.quarantine_dir, exist_ok=True)
-
-        # Look for Python files in the plugins directory
-        plugin_files = glob.glob(os.path.join(self.plugin_dir, "*.py"))
-        loaded_count = 0
-        failed_count = 0
-        quarantined_count = 0
-
-        for plugin_file in plugin_files:
-            plugin_name = os.path.basename(plugin_file)[:-3]
+        new_index = {
+            record[1]: signature + [cache_key]
+            for record, cache_key, signature in results if cache_key and signature
+        }
+        if new_index != index:
+            self._store_plugin_index(new_index)
+        self._prune_plugin_cache({cache_key for _, cache_key, _ in results if cache_key})
+        return [record for record, _, _ in results]
+    
+    def _prepare_plugin_file(self, entry, index=None):
+        """Prepare one plugin file; returns (record, cache_key, signature) for _prepare_plugins."""
+        plugin_file = entry.path
+        plugin_name = entry.name[:-3]
+        cache_key = None
+        signature = None
+        
+        try:
+            # ctime can't be set from user space, so a rewrite that restores
+            # the old mtime still changes the signature
+            st = entry.stat()
+            signature = [st.st_mtime_ns, st.st_ctime_ns, st.st_size]
+            indexed = index.get(plugin_file) if index else None
+            if indexed and indexed[:3] == signature:
+                cached = self._load_cached_plugin(indexed[3])
+                if cached is not None:
+                    return ('ok', plugin_file, plugin_name, cached), indexed[3], signature
             
+            # Read plugin file in one go, sized from the directory scan
+            fd = os.open(plugin_file, os.O_RDONLY)
             try:
-                # Read plugin file
-                with open(plugin_file, 'r') as f:
-                    plugin_code = f.read()
+                chunks = [os.read(fd, st.st_size or 4096)]
+                while chunks[-1]:
+                    chunks.append(os.read(fd, 65536))
+            finally:
+                os.close(fd)
+            plugin_code = b''.join(chunks).decode('utf-8')
 
-                # Step 1: AST validation - check for top-level code
+            # Reuse the validated, compiled plugin if its source is unchanged
+            cache_key = self._plugin_cache_key(plugin_code)
+            cached = self._load_cached_plugin(cache_key)
+            if cached is None:
+                # Step 1: AST validation - check for top-level code and detect imports
                 try:
-                    self._validate_plugin_ast(plugin_code, plugin_name)
+                    tree, plugin_uses_imports, command_names = self._validate_plugin_ast(plugin_code, plugin_name)
                 except ValueError as e:
-                    # Quarantine the plugin
-                    self._move_to_quarantine(plugin_file, f"AST validation failed: {e}")
-                    quarantined_count += 1
-                    warning_msg = (
-                        f"{self.COLOR_ERROR}🚨 SECURITY WARNING: Plugin '{plugin_name}' has been quarantined!{self.COLOR_RESET}\n"
-                        f"  Reason: {e}\n"
-                        f"  The plugin attempted unsafe operations and has been disabled.\n"
-                        f"  Check {self.quarantine_dir} for details.\n"
-                    )
-                    # Store warning to display after banner
-                    self.quarantine_warnings.append(warning_msg)
-                    continue
+                    return ('invalid', plugin_file, plugin_name, e), cache_key, signature
 
-                # Step 2: Detect import usage and, if present, require trust
-                plugin_uses_imports = False
-                try:
-                    tree = ast.parse(plugin_code)
-                    for node in ast.walk(tree):
-                        if isinstance(node, (ast.Import, ast.ImportFrom)):
-                            plugin_uses_imports = True
-                            break
-                except SyntaxError:
-                    # Should already have been caught by _validate_plugin_ast, but be defensive
-                    plugin_uses_imports = False
+                # Compile the already parsed tree rather than the source
+                code_obj = compile(tree, plugin_file, 'exec')
+                self._store_cached_plugin(cache_key, code_obj, plugin_uses_imports, command_names)
+                cached = (code_obj, plugin_uses_imports, command_names)
+            return ('ok', plugin_file, plugin_name, cached), cache_key, signature
+                
+        except Exception as e:
+            logging.error(f"Failed to load plugin '{plugin_name}': {str(e)}")
+            logging.error(f"Plugin file: {plugin_file}")
+            return ('error', plugin_file, plugin_name, e), cache_key, signature
+    
+    def _register_plugins(self, prepared):
+        """Ask for trust where needed and register commands from prepared plugins."""
+        loaded_count = 0
+        failed_count = 0
+        quarantined_count = 0
 
+        for status, plugin_file, plugin_name, detail in prepared:
+            if status == 'error':
+                failed_count += 1
+                continue
+            if status == 'invalid':
+                # Quarantine the plugin
+                self._move_to_quarantine(plugin_file, f"AST validation failed: {detail}")
+                quarantined_count += 1
+                warning_msg = (
+                    f"{self.COLOR_ERROR}🚨 SECURITY WARNING: Plugin '{plugin_name}' has been quarantined!{self.COLOR_RESET}\n"
+                    f"  Reason: {detail}\n"
+                    f"  The plugin attempted unsafe operations and has been disabled.\n"
+                    f"  Check {self.quarantine_dir} for details.\n"
+                )
+                # Store warning to display after banner
+                self.quarantine_warnings.append(warning_msg)
+                continue
+            
+            code_obj, plugin_uses_imports, command_names = detail
+            try:
                 plugin_trusted = False
                 if plugin_uses_imports:
                     if plugin_name in self.trusted_plugins:
@@ -1067,62 +1526,31 @@ ZDTT Terminal v{self.version}
                             self.quarantine_warnings.append(warning_msg)
                             continue
 
-                # Step 3: Sandboxed execution
-                # Create a restricted namespace (sandbox)
-                safe_builtins = {
-                    # Only allow safe builtins
-                    'len': len, 'str': str, 'int': int, 'float': float,
-                    'bool': bool, 'list': list, 'dict': dict, 'tuple': tuple,
-                    'set': set, 'frozenset': frozenset, 'range': range,
-                    'enumerate': enumerate, 'zip': zip, 'map': map, 'filter': filter,
-                    'sorted': sorted, 'reversed': reversed, 'min': min, 'max': max,
-                    'sum': sum, 'abs': abs, 'round': round, 'any': any, 'all': all,
-                    'isinstance': isinstance, 'type': type, 'hasattr': hasattr,
-                    'getattr': getattr, 'setattr': setattr, 'delattr': delattr,
-                    'callable': callable, 'print': print, 'repr': repr,
-                    # Exception classes (safe, required for normal Python code)
-                    'BaseException': BaseException,
-                    'Exception': Exception,
-                    'ImportError': ImportError,
-                    'NameError': NameError,
-                    'ValueError': ValueError,
-                    'TypeError': TypeError,
-                    'RuntimeError': RuntimeError,
-                }
+                allow_imports = plugin_uses_imports and plugin_trusted
 
-                # Allow imports only for trusted plugins that use them
-                if plugin_uses_imports and plugin_trusted:
-                    safe_builtins['__import__'] = __import__
+                # Defer execution until a command is used when the names are known up front;
+                # protected names go through the eager path so the plugin is quarantined
+                if command_names is not None and PROTECTED_COMMANDS.isdisjoint(command_names):
+                    stubs = {
+                        sys.intern(name): functools.partial(self._invoke_lazy_plugin, plugin_name, name)
+                        for name in command_names
+                    }
+                    self._pending_plugins[plugin_name] = (plugin_file, code_obj, allow_imports, stubs)
+                    self.commands.update(stubs)
+                    self.plugin_command_names.update(stubs)
+                    loaded_count += 1
+                    continue
 
-                sandbox = {
-                    '__builtins__': safe_builtins
-                }
-                
-                # Execute plugin in sandbox
+                # Step 3: Sandboxed execution and register_commands()
                 try:
-                    exec(plugin_code, sandbox)
+                    plugin_commands = self._exec_plugin(code_obj, self._plugin_sandbox(allow_imports))
                 except Exception as e:
                     failed_count += 1
                     logging.error(f"Failed to execute plugin '{plugin_name}': {str(e)}")
                     logging.error(f"Plugin file: {plugin_file}")
                     continue
                 
-                # Step 3: Check for register_commands function
-                if 'register_commands' not in sandbox:
-                    raise ValueError("Plugin missing register_commands() function")
-                
-                # Step 4: Call register_commands and validate return value
-                try:
-                    plugin_commands = sandbox['register_commands']()
-                except Exception as e:
-                    failed_count += 1
-                    logging.error(f"register_commands() failed for plugin '{plugin_name}': {str(e)}")
-                    continue
-                
-                if not isinstance(plugin_commands, dict):
-                    raise ValueError("register_commands() must return a dictionary")
-                
-                # Step 5: Validate commands (protected names and callables)
+                # Step 4: Validate commands (protected names and callables)
                 try:
                     self._validate_plugin_commands(plugin_commands, plugin_name)
                 except ValueError as e:
@@ -1139,7 +1567,12 @@ ZDTT Terminal v{self.version}
                     self.quarantine_warnings.append(warning_msg)
                     continue
                 
-                # Step 6: All checks passed - register the commands
+                # Step 5: All checks passed - register the commands
+                # Interned keys let dispatch lookups match by identity
+                plugin_commands = {
+                    sys.intern(name) if type(name) is str else name: func
+                    for name, func in plugin_commands.items()
+                }
                 self.commands.update(plugin_commands)
                 self.plugin_command_names.update(plugin_commands.keys())
                 loaded_count += 1
@@ -1157,82 +1590,270 @@ ZDTT Terminal v{self.version}
             )
             self.quarantine_warnings.append(summary_warning)
         
+        self._invalidate_completions()
+        
         # Note: Individual warnings and summary are stored in self.quarantine_warnings
         # They will be displayed after the banner in run() method
         if failed_count > 0:
             print(f"{self.COLOR_WARNING}⚠ {failed_count} plugin(s) failed to load. Check ~/.zdtt/plugin_errors.log{self.COLOR_RESET}")
 
+    def _prepare_plugins_bg(self):
+        """Thread target: prepare plugins and signal when done."""
+        try:
+            self._prepared_plugins = self._prepare_plugins()
+        except Exception as e:
+            logging.error(f"Failed to prepare plugins: {e}")
+            self._prepared_plugins = []
+        finally:
+            self._plugins_ready.set()
+    
+    def _finish_plugin_loading(self, wait=True):
+        """Register plugins prepared in the background; with wait=False, only if they're ready."""
+        if self._plugin_thread is None:
+            return
+        if not wait and not self._plugins_ready.is_set():
+            return
+        self._plugins_ready.wait()
+        self._plugin_thread = None
+        prepared, self._prepared_plugins = self._prepared_plugins, None
+        self._register_plugins(prepared)
+        
+        # Display security warnings for quarantined plugins (if any)
+        if self.quarantine_warnings:
+            print()
+            for warning in self.quarantine_warnings:
+                print(warning)
+            print()
+    
+    def _plugin_sandbox(self, allow_imports):
+        """Build the restricted globals a plugin is executed in."""
+        # Copy so one plugin can't change the builtins another one sees
+        if allow_imports:
+            safe_builtins = PLUGIN_SAFE_BUILTINS_WITH_IMPORT.copy()
+        else:
+            safe_builtins = PLUGIN_SAFE_BUILTINS.copy()
+        return {'__builtins__': safe_builtins}
+    
+    def _exec_plugin(self, code_obj, sandbox):
+        """Execute a compiled plugin and return the dict from its register_commands()."""
+        exec(code_obj, sandbox)
+        if 'register_commands' not in sandbox:
+            raise ValueError("Plugin missing register_commands() function")
+        plugin_commands = sandbox['register_commands']()
+        if not isinstance(plugin_commands, dict):
+            raise ValueError("register_commands() must return a dictionary")
+        return plugin_commands
+    
+    def _activate_plugin(self, plugin_name):
+        """Execute a deferred plugin and swap its stubs for the real commands."""
+        entry = self._pending_plugins.pop(plugin_name, None)
+        if entry is None:
+            return None
+        plugin_file, code_obj, allow_imports, stubs = entry
+        try:
+            plugin_commands = self._exec_plugin(code_obj, self._plugin_sandbox(allow_imports))
+        except Exception as e:
+            logging.error(f"Failed to load plugin '{plugin_name}': {str(e)}")
+            logging.error(f"Plugin file: {plugin_file}")
+            plugin_commands = {}
+        
+        try:
+            self._validate_plugin_commands(plugin_commands, plugin_name)
+        except ValueError as e:
+            # Quarantine the plugin, as the eager path does
+            self._move_to_quarantine(plugin_file, f"Command validation failed: {e}")
+            warning_msg = (
+                f"{self.COLOR_ERROR}🚨 SECURITY WARNING: Plugin '{plugin_name}' has been quarantined!{self.COLOR_RESET}\n"
+                f"  Reason: {e}\n"
+                f"  The plugin registered invalid commands and has been disabled.\n"
+                f"  Check {self.quarantine_dir} for details.\n"
+            )
+            self.quarantine_warnings.append(warning_msg)
+            print()
+            print(warning_msg)
+            plugin_commands = {}
+        
+        for name, stub in stubs.items():
+            # Leave names that a later plugin has since taken over
+            if self.commands.get(name) is not stub:
+                continue
+            if name in plugin_commands:
+                self.commands[name] = plugin_commands[name]
+            else:
+                del self.commands[name]
+                self.plugin_command_names.discard(name)
+        self._invalidate_completions()
+        return plugin_commands
+    
+    def _invoke_lazy_plugin(self, plugin_name, command_name, args):
+        """Stub for a deferred plugin command: load the plugin, then run the command."""
+        plugin_commands = self._activate_plugin(plugin_name)
+        func = plugin_commands.get(command_name) if plugin_commands else None
+        if func is None:
+            print(f"{self.COLOR_ERROR}Plugin '{plugin_name}' failed to load. Check ~/.zdtt/plugin_errors.log{self.COLOR_RESET}")
+            return None
+        return func(args)
+    
+    def _plugin_cache_key(self, plugin_code):
+        """Hash plugin source together with the interpreter's bytecode tag."""
+        # Code objects are only valid for the interpreter version that made them
+        import hashlib
+
+        tag = (sys.implementation.cache_tag or '').encode()
+        return hashlib.sha256(tag + plugin_code.encode('utf-8')).hexdigest()
+    
+    def _load_cached_plugin(self, cache_key):
+        """Return (code_obj, uses_imports, command_names) for a validated plugin, or None."""
+        base = os.path.join(self.plugin_cache_dir, cache_key)
+        try:
+            meta = _read_json_file(base + '.json')
+            # Entries written before command names were recorded count as misses
+            if not meta.get('validated') or 'commands' not in meta:
+                return None
+            with open(base + '.pyc', 'rb') as f:
+                code_obj = marshal.load(f)
+        except (OSError, ValueError, EOFError, TypeError):
+            # Missing or damaged entry: treat as a miss and revalidate
+            return None
+        return code_obj, bool(meta.get('uses_imports')), meta['commands']
+    
+    def _store_cached_plugin(self, cache_key, code_obj, uses_imports, command_names):
+        """Persist a validated plugin's code object, import flag and command names."""
+        base = os.path.join(self.plugin_cache_dir, cache_key)
+        try:
+            os.makedirs(self.plugin_cache_dir, exist_ok=True)
+            # Code first: the metadata file only appears once the code is complete.
+            # Both go through per-thread temp files, since identical plugin files
+            # share a key and may be stored concurrently
+            tmp_suffix = f".{threading.get_ident()}.tmp"
+            with open(base + '.pyc' + tmp_suffix, 'wb') as f:
+                marshal.dump(code_obj, f)
+            os.replace(base + '.pyc' + tmp_suffix, base + '.pyc')
+            with open(base + '.json' + tmp_suffix, 'w') as f:
+                json.dump({'uses_imports': uses_imports, 'commands': command_names, 'validated': True}, f)
+            os.replace(base + '.json' + tmp_suffix, base + '.json')
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to cache plugin {cache_key}: {e}")
+    
+    def _load_plugin_index(self):
+        """Return {plugin path: [mtime_ns, ctime_ns, size, cache_key]} from the last load."""
+        try:
+            index = _read_json_file(os.path.join(self.plugin_cache_dir, 'index.json'))
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+    
+    def _store_plugin_index(self, index):
+        """Persist the stat signature -> cache key index for the next startup."""
+        path = os.path.join(self.plugin_cache_dir, 'index.json')
+        try:
+            os.makedirs(self.plugin_cache_dir, exist_ok=True)
+            with open(path + '.tmp', 'w') as f:
+                json.dump(index, f)
+            os.replace(path + '.tmp', path)
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to save plugin cache index: {e}")
+    
+    def _prune_plugin_cache(self, keep_keys):
+        """Drop cache entries for plugin sources that no longer exist."""
+        try:
+            with os.scandir(self.plugin_cache_dir) as it:
+                stale = [
+                    e.path for e in it
+                    if e.name.split('.', 1)[0] not in keep_keys and e.name != 'index.json'
+                ]
+        except FileNotFoundError:
+            return
+        for path in stale:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
     def unload_plugin_commands(self):
         """Remove commands that originated from plugins."""
         for cmd_name in list(self.plugin_command_names):
             self.commands.pop(cmd_name, None)
         self.plugin_command_names.clear()
+        self._pending_plugins.clear()
+        self._invalidate_completions()
     
     def load_aliases(self):
         """Load user-defined aliases from file"""
+        self._invalidate_completions()
+        self._alias_text = None
         if not os.path.exists(self.aliases_file):
             return
         
         try:
-            with open(self.aliases_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Parse alias definition: alias_name=command
-                    if '=' in line:
-                        name, command = line.split('=', 1)
-                        name = name.strip()
-                        command = command.strip()
-                        if name and command:
-                            self.aliases[name] = command
+            # Read the whole file at once and split it in C rather than iterating lines
+            with open(self.aliases_file, 'rb') as f:
+                data = f.read()
+            for line in data.decode('utf-8', 'replace').splitlines():
+                line = line.strip()
+                # Skip empty lines and comments
+                if not line or line.startswith('#'):
+                    continue
+                
+                # Parse alias definition: alias_name=command
+                if '=' in line:
+                    name, command = line.split('=', 1)
+                    name = name.strip()
+                    command = command.strip()
+                    if name and command:
+                        self.aliases[name] = command
         except Exception as e:
             logging.error(f"Failed to load aliases: {e}")
     
     def save_aliases(self):
         """Save aliases to file"""
+        lines = ["# ZDTT Terminal Aliases\n", "# Format: alias_name=command\n", "#\n"]
+        lines.extend(f"{name}={command}\n" for name, command in sorted(self.aliases.items()))
         try:
             with open(self.aliases_file, 'w') as f:
-                f.write("# ZDTT Terminal Aliases\n")
-                f.write("# Format: alias_name=command\n")
-                f.write("#\n")
-                for name, command in sorted(self.aliases.items()):
-                    f.write(f"{name}={command}\n")
+                f.write("".join(lines))
         except Exception as e:
             logging.error(f"Failed to save aliases: {e}")
             print(f"{self.COLOR_ERROR}Error: Failed to save aliases: {e}{self.COLOR_RESET}")
     
     def expand_aliases(self, command_line):
         """Expand aliases in command line"""
-        parts = command_line.strip().split()
+        # Only the first word can be an alias, so split it off and leave the
+        # rest of the line (including any quoted spacing) as typed
+        parts = command_line.split(None, 1)
         if not parts:
             return command_line
         
         # Check if the first word is an alias
-        cmd = parts[0]
-        if cmd in self.aliases:
-            # Replace the alias with its command
-            expanded = self.aliases[cmd]
-            # Add any remaining arguments
-            if len(parts) > 1:
-                expanded += ' ' + ' '.join(parts[1:])
-            return expanded
-        
-        return command_line
+        expanded = self.aliases.get(parts[0])
+        if expanded is None:
+            return command_line
+        # Add any remaining arguments
+        if len(parts) > 1:
+            expanded += ' ' + parts[1].rstrip()
+        return expanded
     
     def get_prompt(self):
         """Return the custom prompt string with enhanced colors"""
         # Show current directory in prompt
         cwd = os.getcwd()
+        # Only the directory changes between prompts, so reuse the last build
+        if self._prompt_cache is not None and self._prompt_cache[0] == cwd:
+            return self._prompt_cache[1]
+        
         # Show ~ for home directory
-        home = os.path.expanduser("~")
+        home = self._home
         if cwd.startswith(home):
-            display_path = "~" + cwd[len(home):]
+            display_path = f"~{cwd[len(home):]}"
         else:
             display_path = cwd
         
+        prompt = self._prompt_head + display_path + self._prompt_tail
+        self._prompt_cache = (cwd, prompt)
+        return prompt
+    
+    def _build_prompt_parts(self):
+        """Format the fixed text around the path in the prompt, once."""
         # Wrap ANSI codes in \001 and \002 so readline knows they're non-printable
         # This fixes line wrapping issues with long commands
         RL_PROMPT_START = '\001'
@@ -1240,75 +1861,91 @@ ZDTT Terminal v{self.version}
         
         # Create enhanced colorized prompt with gradient-like effect
         # [username in bright green @ ZDTT in bright cyan path in bright blue]=>
-        prompt = (f"{RL_PROMPT_START}{self.COLOR_BRIGHT_CYAN}{RL_PROMPT_END}┌─{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END}"
-                 f"[{RL_PROMPT_START}{self.COLOR_BRIGHT_GREEN}{RL_PROMPT_END}{self.username}"
-                 f"{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END}"
-                 f"{RL_PROMPT_START}{self.COLOR_BRIGHT_WHITE}{RL_PROMPT_END}@{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END}"
-                 f"{RL_PROMPT_START}{self.COLOR_BRIGHT_CYAN}{RL_PROMPT_END}ZDTT{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END} "
-                 f"{RL_PROMPT_START}{self.COLOR_BRIGHT_BLUE}{RL_PROMPT_END}{display_path}"
-                 f"{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END}]"
-                 f"{RL_PROMPT_START}{self.COLOR_BRIGHT_CYAN}{RL_PROMPT_END}─{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END}\n"
-                 f"{RL_PROMPT_START}{self.COLOR_BRIGHT_CYAN}{RL_PROMPT_END}└─{RL_PROMPT_START}{self.COLOR_BRIGHT_MAGENTA}{RL_PROMPT_END}➜{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END} ")
-        return prompt
+        self._prompt_head = (f"{RL_PROMPT_START}{self.COLOR_BRIGHT_CYAN}{RL_PROMPT_END}┌─{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END}"
+                             f"[{RL_PROMPT_START}{self.COLOR_BRIGHT_GREEN}{RL_PROMPT_END}{self.username}"
+                             f"{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END}"
+                             f"{RL_PROMPT_START}{self.COLOR_BRIGHT_WHITE}{RL_PROMPT_END}@{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END}"
+                             f"{RL_PROMPT_START}{self.COLOR_BRIGHT_CYAN}{RL_PROMPT_END}ZDTT{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END} "
+                             f"{RL_PROMPT_START}{self.COLOR_BRIGHT_BLUE}{RL_PROMPT_END}")
+        self._prompt_tail = (f"{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END}]"
+                             f"{RL_PROMPT_START}{self.COLOR_BRIGHT_CYAN}{RL_PROMPT_END}─{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END}\n"
+                             f"{RL_PROMPT_START}{self.COLOR_BRIGHT_CYAN}{RL_PROMPT_END}└─{RL_PROMPT_START}{self.COLOR_BRIGHT_MAGENTA}{RL_PROMPT_END}➜{RL_PROMPT_START}{self.COLOR_RESET}{RL_PROMPT_END} ")
+    
+    def _emit(self, lines):
+        """Print lines with a single write instead of one print per line."""
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    def _clear_screen(self):
+        """Clear the screen (and scrollback) without spawning clear(1)."""
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            sys.stdout.write('\x1b[H\x1b[2J\x1b[3J')
+            sys.stdout.flush()
     
     def cmd_help(self, args):
         """Display available commands with enhanced formatting"""
-        print()
-        print(f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}╔═══════════════════════════════════════════════════════════╗{self.COLOR_RESET}")
-        print(f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}║{self.COLOR_RESET}  {self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}ZDTT Terminal Commands{self.COLOR_RESET}                                    {self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}║{self.COLOR_RESET}")
-        print(f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}╚═══════════════════════════════════════════════════════════╝{self.COLOR_RESET}")
-        print()
-        print(f"{self.COLOR_BRIGHT_MAGENTA}{self.COLOR_BOLD}Core Commands:{self.COLOR_RESET}")
-        print(f"  {self.COLOR_BRIGHT_GREEN}help{self.COLOR_RESET}                 - Display this help message")
-        print(f"  {self.COLOR_BRIGHT_GREEN}clear{self.COLOR_RESET}                - Clear the screen")
-        print(f"  {self.COLOR_BRIGHT_GREEN}echo{self.COLOR_RESET} <message>       - Echo a message")
-        print(f"  {self.COLOR_BRIGHT_GREEN}about{self.COLOR_RESET}                - About ZDTT Terminal")
-        print(f"  {self.COLOR_BRIGHT_GREEN}history{self.COLOR_RESET}              - Show command history")
-        print(f"  {self.COLOR_BRIGHT_GREEN}plugins{self.COLOR_RESET} [reload]     - List or reload plugins")
-        print(f"  {self.COLOR_BRIGHT_GREEN}alias{self.COLOR_RESET} [name=cmd]     - Create or display command aliases")
-        print(f"  {self.COLOR_BRIGHT_GREEN}unalias{self.COLOR_RESET} <name>       - Remove an alias")
-        print(f"  {self.COLOR_BRIGHT_GREEN}zps{self.COLOR_RESET} install <url>    - Install plugin from URL")
-        print(f"  {self.COLOR_BRIGHT_GREEN}time{self.COLOR_RESET} [options]       - Display date/time (MM/DD/YY 12h default)")
-        print(f"  {self.COLOR_BRIGHT_GREEN}statusbar{self.COLOR_RESET} color <name> - Change status bar highlight color")
-        print(f"  {self.COLOR_BRIGHT_GREEN}update{self.COLOR_RESET}               - Run the ZDTT updater helper")
-        print(f"  {self.COLOR_BRIGHT_GREEN}exit{self.COLOR_RESET}                 - Exit ZDTT (return to shell)")
-        print(f"  {self.COLOR_BRIGHT_GREEN}quit{self.COLOR_RESET}                 - Quit and close terminal window")
-        print()
-        print(f"{self.COLOR_BRIGHT_MAGENTA}{self.COLOR_BOLD}File System Commands:{self.COLOR_RESET}")
-        print(f"  {self.COLOR_BRIGHT_GREEN}ls{self.COLOR_RESET} [options]         - List directory contents")
-        print(f"  {self.COLOR_BRIGHT_GREEN}pwd{self.COLOR_RESET}                  - Print working directory")
-        print(f"  {self.COLOR_BRIGHT_GREEN}cd{self.COLOR_RESET} <directory>       - Change directory")
-        print(f"  {self.COLOR_BRIGHT_GREEN}cat{self.COLOR_RESET} <file>           - Display file contents")
-        print(f"  {self.COLOR_BRIGHT_GREEN}mkdir{self.COLOR_RESET} <directory>    - Create directory")
-        print(f"  {self.COLOR_BRIGHT_GREEN}touch{self.COLOR_RESET} <file>         - Create empty file")
-        print(f"  {self.COLOR_BRIGHT_GREEN}rm{self.COLOR_RESET} [-rf] <file>      - Remove file/directory (prompts without -f)")
-        print(f"  {self.COLOR_BRIGHT_GREEN}mv{self.COLOR_RESET} <src> <dest>      - Move/rename file")
-        print(f"  {self.COLOR_BRIGHT_GREEN}cp{self.COLOR_RESET} [-r] <src> <dest> - Copy file")
-        print(f"  {self.COLOR_BRIGHT_GREEN}grep{self.COLOR_RESET} <pattern> <file> - Search for pattern in file")
-        print()
-        print(f"{self.COLOR_BRIGHT_MAGENTA}{self.COLOR_BOLD}System Commands:{self.COLOR_RESET}")
-        print(f"  {self.COLOR_BRIGHT_GREEN}whoami{self.COLOR_RESET}               - Display current user")
-        print(f"  {self.COLOR_BRIGHT_GREEN}date{self.COLOR_RESET}                 - Display current date/time")
-        print(f"  {self.COLOR_BRIGHT_GREEN}uname{self.COLOR_RESET} [options]      - Display system information")
-        print(f"  {self.COLOR_BRIGHT_GREEN}nano{self.COLOR_RESET} <file>          - Edit file with nano")
-        print(f"  {self.COLOR_BRIGHT_GREEN}sysfetch{self.COLOR_RESET}             - Display system info (prefers distro tools)")
-        print()
-        print(f"{self.COLOR_BRIGHT_MAGENTA}{self.COLOR_BOLD}Python Commands:{self.COLOR_RESET}")
-        print(f"  {self.COLOR_BRIGHT_GREEN}python{self.COLOR_RESET} [args]        - Run Python interpreter")
-        print(f"  {self.COLOR_BRIGHT_GREEN}python3{self.COLOR_RESET} [args]       - Run Python 3 interpreter")
-        print(f"  {self.COLOR_BRIGHT_GREEN}pip{self.COLOR_RESET} [args]           - Run pip package manager")
-        print(f"  {self.COLOR_BRIGHT_GREEN}pip3{self.COLOR_RESET} [args]          - Run pip3 package manager")
-        print()
-        print(f"{self.COLOR_BRIGHT_MAGENTA}{self.COLOR_BOLD}Features:{self.COLOR_RESET}")
-        print(f"  {self.COLOR_BRIGHT_YELLOW}↑/↓ arrows{self.COLOR_RESET}           - Navigate command history")
-        print(f"  {self.COLOR_BRIGHT_YELLOW}Tab{self.COLOR_RESET}                  - Auto-complete commands/files")
-        print(f"  {self.COLOR_BRIGHT_YELLOW}Auto shell fallback{self.COLOR_RESET} - Unknown commands run in system shell")
-        print(f"                         {self.COLOR_DIM}Example: htop (auto-runs in shell){self.COLOR_RESET}")
-        print()
+        # The help text never changes, so format it once and reuse it
+        if self._help_text is None:
+            self._help_text = "\n".join([
+                "",
+                f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}╔═══════════════════════════════════════════════════════════╗{self.COLOR_RESET}",
+                f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}║{self.COLOR_RESET}  {self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}ZDTT Terminal Commands{self.COLOR_RESET}                                    {self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}║{self.COLOR_RESET}",
+                f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}╚═══════════════════════════════════════════════════════════╝{self.COLOR_RESET}",
+                "",
+                f"{self.COLOR_BRIGHT_MAGENTA}{self.COLOR_BOLD}Core Commands:{self.COLOR_RESET}",
+                f"  {self.COLOR_BRIGHT_GREEN}help{self.COLOR_RESET}                 - Display this help message",
+                f"  {self.COLOR_BRIGHT_GREEN}clear{self.COLOR_RESET}                - Clear the screen",
+                f"  {self.COLOR_BRIGHT_GREEN}echo{self.COLOR_RESET} <message>       - Echo a message",
+                f"  {self.COLOR_BRIGHT_GREEN}about{self.COLOR_RESET}                - About ZDTT Terminal",
+                f"  {self.COLOR_BRIGHT_GREEN}history{self.COLOR_RESET}              - Show command history",
+                f"  {self.COLOR_BRIGHT_GREEN}plugins{self.COLOR_RESET} [reload]     - List or reload plugins",
+                f"  {self.COLOR_BRIGHT_GREEN}alias{self.COLOR_RESET} [name=cmd]     - Create or display command aliases",
+                f"  {self.COLOR_BRIGHT_GREEN}unalias{self.COLOR_RESET} <name>       - Remove an alias",
+                f"  {self.COLOR_BRIGHT_GREEN}zps{self.COLOR_RESET} install <url>    - Install plugin from URL",
+                f"  {self.COLOR_BRIGHT_GREEN}time{self.COLOR_RESET} [options]       - Display date/time (MM/DD/YY 12h default)",
+                f"  {self.COLOR_BRIGHT_GREEN}statusbar{self.COLOR_RESET} color <name> - Change status bar highlight color",
+                f"  {self.COLOR_BRIGHT_GREEN}update{self.COLOR_RESET}               - Run the ZDTT updater helper",
+                f"  {self.COLOR_BRIGHT_GREEN}exit{self.COLOR_RESET}                 - Exit ZDTT (return to shell)",
+                f"  {self.COLOR_BRIGHT_GREEN}quit{self.COLOR_RESET}                 - Quit and close terminal window",
+                "",
+                f"{self.COLOR_BRIGHT_MAGENTA}{self.COLOR_BOLD}File System Commands:{self.COLOR_RESET}",
+                f"  {self.COLOR_BRIGHT_GREEN}ls{self.COLOR_RESET} [options]         - List directory contents",
+                f"  {self.COLOR_BRIGHT_GREEN}pwd{self.COLOR_RESET}                  - Print working directory",
+                f"  {self.COLOR_BRIGHT_GREEN}cd{self.COLOR_RESET} <directory>       - Change directory",
+                f"  {self.COLOR_BRIGHT_GREEN}cat{self.COLOR_RESET} <file>           - Display file contents",
+                f"  {self.COLOR_BRIGHT_GREEN}mkdir{self.COLOR_RESET} <directory>    - Create directory",
+                f"  {self.COLOR_BRIGHT_GREEN}touch{self.COLOR_RESET} <file>         - Create empty file",
+                f"  {self.COLOR_BRIGHT_GREEN}rm{self.COLOR_RESET} [-rf] <file>      - Remove file/directory (prompts without -f)",
+                f"  {self.COLOR_BRIGHT_GREEN}mv{self.COLOR_RESET} <src> <dest>      - Move/rename file",
+                f"  {self.COLOR_BRIGHT_GREEN}cp{self.COLOR_RESET} [-r] <src> <dest> - Copy file",
+                f"  {self.COLOR_BRIGHT_GREEN}grep{self.COLOR_RESET} <pattern> <file> - Search for pattern in file",
+                "",
+                f"{self.COLOR_BRIGHT_MAGENTA}{self.COLOR_BOLD}System Commands:{self.COLOR_RESET}",
+                f"  {self.COLOR_BRIGHT_GREEN}whoami{self.COLOR_RESET}               - Display current user",
+                f"  {self.COLOR_BRIGHT_GREEN}date{self.COLOR_RESET}                 - Display current date/time",
+                f"  {self.COLOR_BRIGHT_GREEN}uname{self.COLOR_RESET} [options]      - Display system information",
+                f"  {self.COLOR_BRIGHT_GREEN}nano{self.COLOR_RESET} <file>          - Edit file with nano",
+                f"  {self.COLOR_BRIGHT_GREEN}sysfetch{self.COLOR_RESET}             - Display system info (prefers distro tools)",
+                "",
+                f"{self.COLOR_BRIGHT_MAGENTA}{self.COLOR_BOLD}Python Commands:{self.COLOR_RESET}",
+                f"  {self.COLOR_BRIGHT_GREEN}python{self.COLOR_RESET} [args]        - Run Python interpreter",
+                f"  {self.COLOR_BRIGHT_GREEN}python3{self.COLOR_RESET} [args]       - Run Python 3 interpreter",
+                f"  {self.COLOR_BRIGHT_GREEN}pip{self.COLOR_RESET} [args]           - Run pip package manager",
+                f"  {self.COLOR_BRIGHT_GREEN}pip3{self.COLOR_RESET} [args]          - Run pip3 package manager",
+                "",
+                f"{self.COLOR_BRIGHT_MAGENTA}{self.COLOR_BOLD}Features:{self.COLOR_RESET}",
+                f"  {self.COLOR_BRIGHT_YELLOW}↑/↓ arrows{self.COLOR_RESET}           - Navigate command history",
+                f"  {self.COLOR_BRIGHT_YELLOW}Tab{self.COLOR_RESET}                  - Auto-complete commands/files",
+                f"  {self.COLOR_BRIGHT_YELLOW}Auto shell fallback{self.COLOR_RESET} - Unknown commands run in system shell",
+                f"                         {self.COLOR_DIM}Example: htop (auto-runs in shell){self.COLOR_RESET}",
+                "",
+            ]) + "\n"
+        sys.stdout.write(self._help_text)
     
     def cmd_clear(self, args):
         """Clear the terminal screen"""
-        os.system('clear' if os.name != 'nt' else 'cls')
+        self._clear_screen()
         self._set_scroll_region()
         self._render_status_bar()
         self.display_banner()
@@ -1316,7 +1953,7 @@ ZDTT Terminal v{self.version}
     def cmd_exit(self, args):
         """Exit ZDTT Terminal (returns to parent shell)"""
         print("Goodbye!")
-        os.system('clear' if os.name != 'nt' else 'cls')
+        self._clear_screen()
         self.running = False
     
     def cmd_quit(self, args):
@@ -1328,49 +1965,53 @@ ZDTT Terminal v{self.version}
     
     def cmd_about(self, args):
         """Display information about ZDTT Terminal with enhanced formatting"""
-        print()
-        print(f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}╔═══════════════════════════════════════════════════════════╗{self.COLOR_RESET}")
-        print(f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}║{self.COLOR_RESET}  {self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}About ZDTT Terminal{self.COLOR_RESET}                                        {self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}║{self.COLOR_RESET}")
-        print(f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}╚═══════════════════════════════════════════════════════════╝{self.COLOR_RESET}")
-        print()
-        print(f"  {self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}Version:{self.COLOR_RESET} {self.COLOR_BRIGHT_WHITE}v{self.version}{self.COLOR_RESET}")
-        print(f"  {self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}Description:{self.COLOR_RESET} A custom terminal interface for Debian-based, Arch Linux, and macOS systems")
-        print()
+        # Bind the colors once; every line below uses several of them
+        green, cyan, magenta = self.COLOR_BRIGHT_GREEN, self.COLOR_BRIGHT_CYAN, self.COLOR_BRIGHT_MAGENTA
+        bold, dim, reset = self.COLOR_BOLD, self.COLOR_DIM, self.COLOR_RESET
+        warning, white = self.COLOR_WARNING, self.COLOR_BRIGHT_WHITE
+        lines = []
+        lines.append("")
+        lines.append(self.ABOUT_HEADER)
+        lines.append("")
+        lines.append(f"  {cyan}{bold}Version:{reset} {white}v{self.version}{reset}")
+        lines.append(f"  {cyan}{bold}Description:{reset} A custom terminal interface for Debian-based, Arch Linux, and macOS systems")
+        lines.append("")
         
         # Show distribution status with colors
-        print(f"  {self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}System Status:{self.COLOR_RESET}")
+        lines.append(f"  {cyan}{bold}System Status:{reset}")
         if self.is_debian:
-            print(f"    {self.COLOR_BRIGHT_GREEN}✓{self.COLOR_RESET} Debian-based system {self.COLOR_BRIGHT_GREEN}(fully supported){self.COLOR_RESET}")
+            lines.append(f"    {green}✓{reset} Debian-based system {green}(fully supported){reset}")
         elif self.is_arch:
-            print(f"    {self.COLOR_BRIGHT_GREEN}✓{self.COLOR_RESET} Arch Linux {self.COLOR_BRIGHT_GREEN}(fully supported){self.COLOR_RESET}")
+            lines.append(f"    {green}✓{reset} Arch Linux {green}(fully supported){reset}")
         elif self.is_mac:
-            print(f"    {self.COLOR_BRIGHT_GREEN}✓{self.COLOR_RESET} macOS {self.COLOR_BRIGHT_GREEN}(kinda supported){self.COLOR_RESET}")
+            lines.append(f"    {green}✓{reset} macOS {green}(kinda supported){reset}")
         else:
-            print(f"    {self.COLOR_WARNING}⚠{self.COLOR_RESET} Unsupported system {self.COLOR_WARNING}(limited support){self.COLOR_RESET}")
-        
-        print()
-        print(f"  {self.COLOR_BRIGHT_MAGENTA}{self.COLOR_BOLD}Features:{self.COLOR_RESET}")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Automatic update checking on startup")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Command history with ↑/↓ navigation (1000 commands)")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Tab completion for commands and files")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Command aliases (alias g=git)")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Flexible time/date display with multiple formats")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Colorized prompt with enhanced styling")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Smart banner (auto-hides on small terminals)")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Plugin system with ZPS package manager")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Plugin hot-reload (plugins reload)")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Safe rm with confirmation prompts")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Custom banner support (~/.zdtt/banner.txt)")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Native command support")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Auto shell fallback for unknown commands")
-        print(f"    {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} Clean, premium interface")
-        print()
-        print(f"  {self.COLOR_BRIGHT_MAGENTA}{self.COLOR_BOLD}Configuration:{self.COLOR_RESET}")
-        print(f"    {self.COLOR_DIM}•{self.COLOR_RESET} ZDTT directory: {self.COLOR_BRIGHT_CYAN}{self.zdtt_dir}{self.COLOR_RESET}")
-        print(f"    {self.COLOR_DIM}•{self.COLOR_RESET} Aliases: {self.COLOR_BRIGHT_CYAN}{self.aliases_file}{self.COLOR_RESET}")
-        print(f"    {self.COLOR_DIM}•{self.COLOR_RESET} Custom banner: {self.COLOR_BRIGHT_CYAN}{self.banner_file}{self.COLOR_RESET}")
-        print(f"    {self.COLOR_DIM}•{self.COLOR_RESET} Plugin errors: {self.COLOR_BRIGHT_CYAN}{self.log_file}{self.COLOR_RESET}")
-        print()
+            lines.append(f"    {warning}⚠{reset} Unsupported system {warning}(limited support){reset}")
+        
+        lines.append("")
+        lines.append(f"  {magenta}{bold}Features:{reset}")
+        lines.append(f"    {green}•{reset} Automatic update checking on startup")
+        lines.append(f"    {green}•{reset} Command history with ↑/↓ navigation (1000 commands)")
+        lines.append(f"    {green}•{reset} Tab completion for commands and files")
+        lines.append(f"    {green}•{reset} Command aliases (alias g=git)")
+        lines.append(f"    {green}•{reset} Flexible time/date display with multiple formats")
+        lines.append(f"    {green}•{reset} Colorized prompt with enhanced styling")
+        lines.append(f"    {green}•{reset} Smart banner (auto-hides on small terminals)")
+        lines.append(f"    {green}•{reset} Plugin system with ZPS package manager")
+        lines.append(f"    {green}•{reset} Plugin hot-reload (plugins reload)")
+        lines.append(f"    {green}•{reset} Safe rm with confirmation prompts")
+        lines.append(f"    {green}•{reset} Custom banner support (~/.zdtt/banner.txt)")
+        lines.append(f"    {green}•{reset} Native command support")
+        lines.append(f"    {green}•{reset} Auto shell fallback for unknown commands")
+        lines.append(f"    {green}•{reset} Clean, premium interface")
+        lines.append("")
+        lines.append(f"  {magenta}{bold}Configuration:{reset}")
+        lines.append(f"    {dim}•{reset} ZDTT directory: {cyan}{self.zdtt_dir}{reset}")
+        lines.append(f"    {dim}•{reset} Aliases: {cyan}{self.aliases_file}{reset}")
+        lines.append(f"    {dim}•{reset} Custom banner: {cyan}{self.banner_file}{reset}")
+        lines.append(f"    {dim}•{reset} Plugin errors: {cyan}{self.log_file}{reset}")
+        lines.append("")
+        self._emit(lines)
     
     def cmd_history(self, args):
         """Display command history with enhanced formatting"""
@@ -1387,21 +2028,34 @@ ZDTT Terminal v{self.version}
         
         start = max(1, history_length - limit + 1)
         
-        print()
-        print(f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}Command History:{self.COLOR_RESET} (showing {limit} of {history_length} commands)")
-        print(f"{self.COLOR_DIM}{'─' * 60}{self.COLOR_RESET}")
+        rule = f"{self.COLOR_DIM}{'─' * 60}{self.COLOR_RESET}"
+        lines = [
+            "",
+            f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}Command History:{self.COLOR_RESET} (showing {limit} of {history_length} commands)",
+            rule,
+        ]
+        # Up to 1000 entries: keep lookups out of the loop
+        get_item = readline.get_history_item
+        append = lines.append
+        num_color, cmd_color, reset = self.COLOR_BRIGHT_BLACK, self.COLOR_BRIGHT_CYAN, self.COLOR_RESET
         for i in range(start, history_length + 1):
-            cmd = readline.get_history_item(i)
+            cmd = get_item(i)
             if cmd:
-                print(f"{self.COLOR_BRIGHT_BLACK}{i:4d}{self.COLOR_RESET}  {self.COLOR_BRIGHT_CYAN}{cmd}{self.COLOR_RESET}")
-        print(f"{self.COLOR_DIM}{'─' * 60}{self.COLOR_RESET}")
-        print()
+                append(f"{num_color}{i:4d}{reset}  {cmd_color}{cmd}{reset}")
+        lines.append(rule)
+        lines.append("")
+        self._emit(lines)
     
     def cmd_plugins(self, args):
         """List or reload plugins"""
         # Check for reload subcommand
         if args and args[0] == 'reload':
             print(f"{self.COLOR_BRIGHT_CYAN}Reloading plugins...{self.COLOR_RESET}")
+            # Drop a startup load still in flight; the reload below supersedes it
+            if self._plugin_thread is not None:
+                self._plugins_ready.wait()
+                self._plugin_thread = None
+                self._prepared_plugins = None
             # Remove plugin commands and reload aliases to avoid conflicts
             self.unload_plugin_commands()
             self.aliases.clear()
@@ -1421,60 +2075,84 @@ ZDTT Terminal v{self.version}
             print()
             return
         
-        # List plugins
-        plugin_files = glob.glob(os.path.join(self.plugin_dir, "*.py"))
-        
-        if not plugin_files:
-            print()
-            print(f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}Plugins:{self.COLOR_RESET}")
-            print(f"{self.COLOR_DIM}{'─' * 60}{self.COLOR_RESET}")
-            print(f"{self.COLOR_WARNING}No plugins installed.{self.COLOR_RESET}")
-            print()
-            print(f"Plugin directory: {self.COLOR_BRIGHT_CYAN}{self.plugin_dir}{self.COLOR_RESET}")
-            print()
-            print(f"{self.COLOR_DIM}To create a plugin, create a .py file with a register_commands() function{self.COLOR_RESET}")
-            print(f"{self.COLOR_DIM}that returns a dictionary of command names to functions.{self.COLOR_RESET}")
-            print()
-            print(f"Or use: {self.COLOR_BRIGHT_GREEN}zps install <url>{self.COLOR_RESET} to install from a URL")
-            print()
+        # List plugins (same files the loader considers, in load order)
+        try:
+            with os.scandir(self.plugin_dir) as it:
+                plugin_names = sorted(
+                    entry.name[:-3] for entry in it
+                    if entry.name.endswith('.py') and not entry.name.startswith('.') and entry.is_file()
+                )
+        except FileNotFoundError:
+            plugin_names = []
+        lines = []
+        # Bind the colors once; every line below uses several of them
+        green, cyan, magenta = self.COLOR_BRIGHT_GREEN, self.COLOR_BRIGHT_CYAN, self.COLOR_BRIGHT_MAGENTA
+        bold, dim, reset = self.COLOR_BOLD, self.COLOR_DIM, self.COLOR_RESET
+        warning = self.COLOR_WARNING
+        
+        if not plugin_names:
+            lines.append("")
+            lines.append(f"{cyan}{bold}Plugins:{reset}")
+            lines.append(f"{dim}{'─' * 60}{reset}")
+            lines.append(f"{warning}No plugins installed.{reset}")
+            lines.append("")
+            lines.append(f"Plugin directory: {cyan}{self.plugin_dir}{reset}")
+            lines.append("")
+            lines.append(f"{dim}To create a plugin, create a .py file with a register_commands() function{reset}")
+            lines.append(f"{dim}that returns a dictionary of command names to functions.{reset}")
+            lines.append("")
+            lines.append(f"Or use: {green}zps install <url>{reset} to install from a URL")
+            lines.append("")
+            self._emit(lines)
             return
         
-        print()
-        print(f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}Loaded Plugins:{self.COLOR_RESET} {self.COLOR_BRIGHT_GREEN}({len(plugin_files)}){self.COLOR_RESET}")
-        print(f"{self.COLOR_DIM}{'─' * 60}{self.COLOR_RESET}")
-        for plugin_file in plugin_files:
-            plugin_name = os.path.basename(plugin_file)[:-3]
-            print(f"  {self.COLOR_BRIGHT_GREEN}•{self.COLOR_RESET} {self.COLOR_BRIGHT_CYAN}{plugin_name}{self.COLOR_RESET}")
-        print(f"{self.COLOR_DIM}{'─' * 60}{self.COLOR_RESET}")
-        print()
-        print(f"Plugin directory: {self.COLOR_BRIGHT_CYAN}{self.plugin_dir}{self.COLOR_RESET}")
-        print(f"Error log: {self.COLOR_BRIGHT_CYAN}{self.log_file}{self.COLOR_RESET}")
-        print()
-        print(f"{self.COLOR_BRIGHT_MAGENTA}Commands:{self.COLOR_RESET}")
-        print(f"  {self.COLOR_BRIGHT_GREEN}plugins reload{self.COLOR_RESET}  - Reload all plugins without restarting")
-        print()
+        lines.append("")
+        lines.append(f"{cyan}{bold}Loaded Plugins:{reset} {green}({len(plugin_names)}){reset}")
+        lines.append(f"{dim}{'─' * 60}{reset}")
+        for plugin_name in plugin_names:
+            lines.append(f"  {green}•{reset} {cyan}{plugin_name}{reset}")
+        lines.append(f"{dim}{'─' * 60}{reset}")
+        lines.append("")
+        lines.append(f"Plugin directory: {cyan}{self.plugin_dir}{reset}")
+        lines.append(f"Error log: {cyan}{self.log_file}{reset}")
+        lines.append("")
+        lines.append(f"{magenta}Commands:{reset}")
+        lines.append(f"  {green}plugins reload{reset}  - Reload all plugins without restarting")
+        lines.append("")
+        self._emit(lines)
     
     def cmd_alias(self, args):
         """Create or display command aliases"""
         if not args:
-            # Display all aliases
-            if not self.aliases:
-                print()
-                print(f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}Aliases:{self.COLOR_RESET}")
-                print(f"{self.COLOR_DIM}{'─' * 60}{self.COLOR_RESET}")
-                print(f"{self.COLOR_WARNING}No aliases defined.{self.COLOR_RESET}")
-                print()
-                print(f"Usage: {self.COLOR_BRIGHT_GREEN}alias name=command{self.COLOR_RESET}")
-                print(f"Example: {self.COLOR_BRIGHT_GREEN}alias g=git{self.COLOR_RESET}")
-                print()
-            else:
-                print()
-                print(f"{self.COLOR_BRIGHT_CYAN}{self.COLOR_BOLD}Defined Aliases:{self.COLOR_RESET} {self.COLOR_BRIGHT_GREEN}({len(self.aliases)}){self.COLOR_RESET}")
-                print(f"{self.COLOR_DIM}{'─' * 60}{self.COLOR_RESET}")
-                for name, command in sorted(self.aliases.items()):
-                    print(f"  {self.COLOR_BRIGHT_GREEN}{name}{self.COLOR_RESET}={self.COLOR_BRIGHT_CYAN}{command}{self.COLOR_RESET}")
-                print(f"{self.COLOR_DIM}{'─' * 60}{self.COLOR_RESET}")
-                print()
+            # Display all aliases; the listing only changes with the aliases
+            if self._alias_text is None:
+                green, cyan, reset = self.COLOR_BRIGHT_GREEN, self.COLOR_BRIGHT_CYAN, self.COLOR_RESET
+                rule = f"{self.COLOR_DIM}{'─' * 60}{reset}"
+                if not self.aliases:
+                    lines = [
+                        "",
+                        f"{cyan}{self.COLOR_BOLD}Aliases:{reset}",
+                        rule,
+                        f"{self.COLOR_WARNING}No aliases defined.{reset}",
+                        "",
+                        f"Usage: {green}alias name=command{reset}",
+                        f"Example: {green}alias g=git{reset}",
+                        "",
+                    ]
+                else:
+                    lines = [
+                        "",
+                        f"{cyan}{self.COLOR_BOLD}Defined Aliases:{reset} {green}({len(self.aliases)}){reset}",
+                        rule,
+                    ]
+                    lines.extend(
+                        f"  {green}{name}{reset}={cyan}{command}{reset}"
+                        for name, command in sorted(self.aliases.items())
+                    )
+                    lines.append(rule)
+                    lines.append("")
+                self._alias_text = "\n".join(lines) + "\n"
+            sys.stdout.write(self._alias_text)
             return
         
         # Parse alias definition
@@ -1504,6 +2182,8 @@ ZDTT Terminal v{self.version}
             print(f"Warning: '{name}' is a built-in command. Alias will take precedence.")
         
         self.aliases[name] = command
+        self._alias_text = None
+        self._invalidate_completions()
         self.save_aliases()
         print(f"Alias created: {name}={command}")
     
@@ -1517,6 +2197,8 @@ ZDTT Terminal v{self.version}
         name = args[0]
         if name in self.aliases:
             del self.aliases[name]
+            self._alias_text = None
+            self._invalidate_completions()
             self.save_aliases()
             print(f"Alias removed: {name}")
         else:
@@ -1525,14 +2207,15 @@ ZDTT Terminal v{self.version}
     def cmd_zps(self, args):
         """ZDTT Package System - Install plugins from URLs"""
         if not args:
-            print("\nZDTT Package System (ZPS)")
-            print("\nUsage:")
-            print("  zps install <url>    - Install plugin from URL")
-            print("  zps list             - List installed plugins (same as 'plugins')")
-            print("\nExamples:")
-            print("  zps install https://plugins.zane.org/example_plugin.py")
-            print("  zps install https://raw.githubusercontent.com/user/repo/plugin.py")
-            print()
+            print(
+                "\nZDTT Package System (ZPS)\n"
+                "\nUsage:\n"
+                "  zps install <url>    - Install plugin from URL\n"
+                "  zps list             - List installed plugins (same as 'plugins')\n"
+                "\nExamples:\n"
+                "  zps install https://plugins.zane.org/example_plugin.py\n"
+                "  zps install https://raw.githubusercontent.com/user/repo/plugin.py\n"
+            )
             return
         
         subcommand = args[0]
@@ -1543,8 +2226,7 @@ ZDTT Terminal v{self.version}
         
         if subcommand == 'install':
             if len(args) < 2:
-                print("zps install: missing URL")
-                print("Usage: zps install <url>")
+                print("zps install: missing URL\nUsage: zps install <url>")
                 return
             
             url = args[1]
@@ -1572,21 +2254,22 @@ ZDTT Terminal v{self.version}
             
             print(f"Downloading {filename}...")
             
+            # Heavy import (http.client, email); only ZPS downloads need it
+            import urllib.request
+            import urllib.error
+            
+            # Stream into a side file and swap it in, so a failed download
+            # never leaves a truncated plugin behind (the loader skips .part)
+            tmp_path = target_path + '.part'
             try:
-                # Download the file
-                with urllib.request.urlopen(url) as response:
-                    plugin_content = response.read()
-                
-                # Write to plugin directory
-                with open(target_path, 'wb') as f:
-                    f.write(plugin_content)
+                with urllib.request.urlopen(url) as response, open(tmp_path, 'wb') as f:
+                    shutil.copyfileobj(response, f, 65536)
+                os.replace(tmp_path, target_path)
                 
                 print(f"{self.COLOR_BRIGHT_GREEN}✓ Plugin '{filename}' installed successfully!{self.COLOR_RESET}")
                 print(f"  Location: {target_path}")
                 print()
-                print("To use the plugin:")
-                print("  1. Type 'plugins reload' to load it now")
-                print("  2. Or restart ZDTT")
+                print("To use the plugin:\n  1. Type 'plugins reload' to load it now\n  2. Or restart ZDTT")
                 print()
                 
             except urllib.error.HTTPError as e:
@@ -1597,6 +2280,11 @@ ZDTT Terminal v{self.version}
                 print(f"Reason: {e.reason}")
             except Exception as e:
                 print(f"{self.COLOR_ERROR}Error: {e}{self.COLOR_RESET}")
+            finally:
+                try:
+                    os.remove(tmp_path)
+                except FileNotFoundError:
+                    pass
             
             return
         
@@ -1605,84 +2293,88 @@ ZDTT Terminal v{self.version}
     
     def cmd_time(self, args):
         """Display current date and time with various formats"""
-        now = datetime.now()
+        # A struct_time is all the fixed formats need; datetime is only built
+        # for --format=, where codes like %f need it
+        now = time_module.localtime()
         
         # Parse arguments
         use_24h = False
         custom_format = None
         
         for arg in args:
-            if arg in ['--24h', '-24', '24h']:
+            # One dict lookup per argument; only unknown ones need the prefix check
+            option = TIME_FLAGS.get(arg)
+            if option is None:
+                if arg.startswith('--format='):
+                    custom_format = arg.split('=', 1)[1]
+            elif option == '24h':
                 use_24h = True
-            elif arg in ['--12h', '-12', '12h']:
+            elif option == '12h':
                 use_24h = False
-            elif arg.startswith('--format='):
-                custom_format = arg.split('=', 1)[1]
-            elif arg in ['--help', '-h']:
-                print("\nTime Command - Display current date and time")
-                print("\nUsage:")
-                print("  time              - Default format (MM/DD/YY 12h)")
-                print("  time --24h        - Use 24-hour format")
-                print("  time --12h        - Use 12-hour format (default)")
-                print("  time --format=... - Custom format string")
-                print("\nPre-defined formats:")
-                print("  time iso          - ISO 8601 format")
-                print("  time full         - Full date and time")
-                print("  time date         - Date only")
-                print("  time clock        - Time only")
-                print("  time unix         - Unix timestamp")
-                print("\nCustom format codes:")
-                print("  %Y - Year (4 digit)    %m - Month (01-12)")
-                print("  %d - Day (01-31)       %H - Hour (00-23)")
-                print("  %I - Hour (01-12)      %M - Minute (00-59)")
-                print("  %S - Second (00-59)    %p - AM/PM")
-                print("  %A - Weekday name      %B - Month name")
-                print("\nExample:")
-                print("  time --format='%Y-%m-%d %H:%M:%S'")
-                print()
+            elif option == 'help':
+                print(
+                    "\nTime Command - Display current date and time\n"
+                    "\nUsage:\n"
+                    "  time              - Default format (MM/DD/YY 12h)\n"
+                    "  time --24h        - Use 24-hour format\n"
+                    "  time --12h        - Use 12-hour format (default)\n"
+                    "  time --format=... - Custom format string\n"
+                    "\nPre-defined formats:\n"
+                    "  time iso          - ISO 8601 format\n"
+                    "  time full         - Full date and time\n"
+                    "  time date         - Date only\n"
+                    "  time clock        - Time only\n"
+                    "  time unix         - Unix timestamp\n"
+                    "\nCustom format codes:\n"
+                    "  %Y - Year (4 digit)    %m - Month (01-12)\n"
+                    "  %d - Day (01-31)       %H - Hour (00-23)\n"
+                    "  %I - Hour (01-12)      %M - Minute (00-59)\n"
+                    "  %S - Second (00-59)    %p - AM/PM\n"
+                    "  %A - Weekday name      %B - Month name\n"
+                    "\nExample:\n"
+                    "  time --format='%Y-%m-%d %H:%M:%S'\n"
+                )
                 return
-            elif arg == 'iso':
+            elif option == 'iso':
                 custom_format = '%Y-%m-%d %H:%M:%S'
                 use_24h = True
-            elif arg == 'full':
+            elif option == 'full':
                 custom_format = '%A, %B %d, %Y at %I:%M:%S %p'
-            elif arg == 'date':
-                print(now.strftime('%m/%d/%y'))
+            elif option == 'date':
+                print(time_module.strftime('%m/%d/%y', now))
                 return
-            elif arg == 'clock':
+            elif option == 'clock':
                 if use_24h:
-                    print(now.strftime('%H:%M:%S'))
+                    print(time_module.strftime('%H:%M:%S', now))
                 else:
-                    print(now.strftime('%I:%M:%S %p'))
+                    print(time_module.strftime('%I:%M:%S %p', now))
                 return
-            elif arg == 'unix':
+            elif option == 'unix':
                 print(int(time_module.time()))
                 return
         
         # Apply custom format if specified
         if custom_format:
             try:
-                print(now.strftime(custom_format))
+                print(datetime.now().strftime(custom_format))
             except Exception as e:
                 print(f"{self.COLOR_ERROR}Error: Invalid format string - {e}{self.COLOR_RESET}")
             return
         
         # Default format: MM/DD/YY with time
-        date_str = now.strftime('%m/%d/%y')
-        
         if use_24h:
-            time_str = now.strftime('%H:%M:%S')
+            print(time_module.strftime('%m/%d/%y %H:%M:%S', now))
         else:
-            time_str = now.strftime('%I:%M:%S %p')
-        
-        print(f"{date_str} {time_str}")
+            print(time_module.strftime('%m/%d/%y %I:%M:%S %p', now))
     
     def cmd_statusbar(self, args):
         """Configure the status bar appearance."""
         if not args:
-            print(f"Status bar color: {self.status_bar_color}")
-            print("Usage: statusbar color <color>")
-            print(f"Available colors: {', '.join(sorted(STATUS_BAR_COLORS.keys()))}")
+            print(
+                f"Status bar color: {self.status_bar_color}\n"
+                "Usage: statusbar color <color>\n"
+                f"Available colors: {STATUS_BAR_COLOR_LIST}"
+            )
             return
         
         subcommand = args[0].lower()
@@ -1691,17 +2383,15 @@ ZDTT Terminal v{self.version}
             return
         
         if len(args) < 2:
-            print("Missing color. Usage: statusbar color <color>")
-            print(f"Available colors: {', '.join(sorted(STATUS_BAR_COLORS.keys()))}")
+            print(f"Missing color. Usage: statusbar color <color>\nAvailable colors: {STATUS_BAR_COLOR_LIST}")
             return
         
         color = args[1].lower()
         if color not in STATUS_BAR_COLORS:
-            print(f"Unsupported color '{color}'.")
-            print(f"Available colors: {', '.join(sorted(STATUS_BAR_COLORS.keys()))}")
+            print(f"Unsupported color '{color}'.\nAvailable colors: {STATUS_BAR_COLOR_LIST}")
             return
         
-        self.status_bar_color = color
+        self._set_status_bar_color(color)
         self.save_preferences()
         self._render_status_bar()
         print(f"{self.COLOR_BRIGHT_GREEN}✓{self.COLOR_RESET} Status bar color updated to {self.COLOR_BRIGHT_CYAN}{color}{self.COLOR_RESET}.")
@@ -1717,8 +2407,7 @@ ZDTT Terminal v{self.version}
     
     def cmd_ls(self, args):
         """List directory contents"""
-        cmd = ['ls', '--color=auto'] + args
-        subprocess.run(cmd)
+        self._spawn_wait(['ls', '--color=auto'] + args)
     
     def cmd_pwd(self, args):
         """Print working directory"""
@@ -1750,10 +2439,14 @@ ZDTT Terminal v{self.version}
             print("cat: missing file operand")
             return
         
+        out = sys.stdout.buffer
         for filename in args:
             try:
-                with open(filename, 'r') as f:
-                    print(f.read(), end='')
+                with open(filename, 'rb') as f:
+                    # Stream raw bytes in chunks; flush pending text first so output stays ordered
+                    sys.stdout.flush()
+                    shutil.copyfileobj(f, out)
+                out.flush()
             except FileNotFoundError:
                 print(f"cat: {filename}: No such file or directory")
             except PermissionError:
@@ -1783,7 +2476,12 @@ ZDTT Terminal v{self.version}
         
         for filename in args:
             try:
-                open(filename, 'a').close()
+                fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC, 0o666)
+                try:
+                    # Like touch(1), also refresh the timestamps of existing files
+                    os.utime(fd if os.utime in os.supports_fd else filename)
+                finally:
+                    os.close(fd)
             except PermissionError:
                 print(f"touch: cannot touch '{filename}': Permission denied")
     
@@ -1794,16 +2492,14 @@ ZDTT Terminal v{self.version}
             return
         
         # Separate flags from paths
-        flags = [arg for arg in args if arg.startswith('-')]
-        paths = [arg for arg in args if not arg.startswith('-')]
+        flags, paths = _parse_flags(args)
         
         if not paths:
             print("rm: missing operand")
             return
         
-        # Check for recursive flag
-        recursive = '-r' in flags or '-rf' in flags or '-fr' in flags
-        force = '-f' in flags or '-rf' in flags or '-fr' in flags
+        recursive = flags & FLAG_RECURSIVE
+        force = flags & FLAG_FORCE
         
         # Check for dangerous paths (root directories and critical system paths)
         dangerous_paths = ['/', '/root', '/home', '/usr', '/bin', '/sbin', '/etc', '/var', 
@@ -1847,11 +2543,14 @@ ZDTT Terminal v{self.version}
         
         for path in allowed_paths:
             try:
-                if os.path.islink(path):
+                # One lstat answers link/file/dir; a missing path has mode 0
+                try:
+                    mode = os.lstat(path).st_mode
+                except FileNotFoundError:
+                    mode = 0
+                if stat.S_ISLNK(mode) or stat.S_ISREG(mode):
                     os.unlink(path)
-                elif os.path.isfile(path):
-                    os.remove(path)
-                elif os.path.isdir(path):
+                elif stat.S_ISDIR(mode):
                     if recursive:
                         # Confirm before removing directory unless -f flag
                         if not force:
@@ -1859,7 +2558,7 @@ ZDTT Terminal v{self.version}
                             abs_path = os.path.abspath(path)
                             try:
                                 # Count items in directory
-                                item_count = sum(len(files) + len(dirs) for _, dirs, files in os.walk(path))
+                                item_count = _count_entries(path)
                                 print(f"rm: remove directory '{abs_path}' and its {item_count} items?")
                             except:
                                 print(f"rm: remove directory '{abs_path}'?")
@@ -1893,11 +2592,23 @@ ZDTT Terminal v{self.version}
         dest = args[1]
         
         try:
-            shutil.move(src, dest)
+            if os.path.isdir(dest):
+                # Moving into a directory: let shutil.move build the target name
+                shutil.move(src, dest)
+            else:
+                try:
+                    # Same-filesystem renames need none of shutil.move's probing
+                    os.rename(src, dest)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.move(src, dest)
         except FileNotFoundError:
             print(f"mv: cannot stat '{src}': No such file or directory")
         except PermissionError:
             print(f"mv: cannot move '{src}': Permission denied")
+        except OSError as e:
+            print(f"mv: cannot move '{src}' to '{dest}': {e.strerror or e}")
     
     def cmd_cp(self, args):
         """Copy file"""
@@ -1906,8 +2617,7 @@ ZDTT Terminal v{self.version}
             return
         
         # Separate flags from paths
-        flags = [arg for arg in args if arg.startswith('-')]
-        paths = [arg for arg in args if not arg.startswith('-')]
+        flags, paths = _parse_flags(args)
         
         if len(paths) < 2:
             print("cp: missing destination file operand")
@@ -1916,13 +2626,15 @@ ZDTT Terminal v{self.version}
         src = paths[0]
         dest = paths[1]
         
-        # Check for recursive flag
-        recursive = '-r' in flags or '-R' in flags
+        recursive = flags & FLAG_RECURSIVE
         
         try:
-            if os.path.isfile(src):
-                shutil.copy2(src, dest)
-            elif os.path.isdir(src):
+            # One stat (following links, like isfile/isdir) for both checks;
+            # a missing source raises FileNotFoundError, handled below
+            mode = os.stat(src).st_mode
+            if stat.S_ISREG(mode):
+                _copy_file(src, dest)
+            elif stat.S_ISDIR(mode):
                 if recursive:
                     shutil.copytree(src, dest)
                 else:
@@ -1935,6 +2647,8 @@ ZDTT Terminal v{self.version}
             print(f"cp: cannot create '{dest}': Permission denied")
         except FileExistsError:
             print(f"cp: cannot create directory '{dest}': File exists")
+        except shutil.SameFileError:
+            print(f"cp: '{src}' and '{dest}' are the same file")
     
     def cmd_grep(self, args):
         """Search for pattern in file"""
@@ -1942,8 +2656,51 @@ ZDTT Terminal v{self.version}
             print("grep: missing pattern or file")
             return
         
-        cmd = ['grep', '--color=auto'] + args
-        subprocess.run(cmd)
+        if len(args) == 2 and self._grep_literal(args[0], args[1]):
+            return
+        self._spawn_wait(['grep', '--color=auto'] + args)
+    
+    def _grep_literal(self, pattern, path):
+        """Search a small file for a plain string without spawning grep.
+        
+        Returns False when grep(1) should handle it instead: options, regex
+        syntax, large/binary/unreadable files (grep reports those itself).
+        """
+        if (not pattern or pattern[0] == '-' or path[:1] == '-'
+                or not GREP_META_CHARS.isdisjoint(pattern)):
+            return False
+        try:
+            st = os.stat(path)
+            if not stat.S_ISREG(st.st_mode) or st.st_size > GREP_LITERAL_MAX_SIZE:
+                return False
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return False
+        if b'\0' in data:
+            return False  # grep prints "Binary file ... matches" for these
+        try:
+            data.decode('utf-8')
+        except UnicodeDecodeError:
+            return False  # Likewise treated as binary in UTF-8 locales
+        
+        out = sys.stdout
+        # Same rule as --color=auto: color only on a terminal that supports it
+        color = out.isatty() and os.environ.get('TERM') != 'dumb'
+        if color and ('GREP_COLORS' in os.environ or 'GREP_COLOR' in os.environ):
+            return False  # Custom match colors; leave them to grep
+        
+        needle = os.fsencode(pattern)
+        if needle not in data:
+            return True
+        lines = [line for line in data.split(b'\n') if needle in line]
+        if color:
+            highlighted = GREP_MATCH_START + needle + GREP_MATCH_END
+            lines = [line.replace(needle, highlighted) for line in lines]
+        out.flush()
+        out.buffer.write(b'\n'.join(lines) + b'\n')
+        out.buffer.flush()
+        return True
     
     # System Commands
     
@@ -1953,11 +2710,22 @@ ZDTT Terminal v{self.version}
     
     def cmd_date(self, args):
         """Display current date/time"""
-        subprocess.run(['date'] + args)
+        if not args:
+            # Same output as date(1) in the C locale, without spawning it
+            print(time_module.strftime('%a %b %e %H:%M:%S %Z %Y'))
+            return
+        self._spawn_wait(['date'] + args)
     
     def cmd_uname(self, args):
         """Display system information"""
-        subprocess.run(['uname'] + args)
+        # Single-field queries are answered from os.uname() without spawning
+        if not args:
+            print(os.uname().sysname)
+            return
+        if len(args) == 1 and args[0] in UNAME_FLAG_FIELDS:
+            print(getattr(os.uname(), UNAME_FLAG_FIELDS[args[0]]))
+            return
+        self._spawn_wait(['uname'] + args)
     
     def cmd_nano(self, args):
         """Edit file with nano"""
@@ -1965,12 +2733,12 @@ ZDTT Terminal v{self.version}
             print("nano: missing file operand")
             return
         
-        subprocess.run(['nano'] + args)
+        self._spawn_wait(['nano'] + args)
     
     def cmd_sysfetch(self, args):
         """Display system info using distro-preferred fetch tool."""
         def _find_tool_binary(tool_name):
-            candidate = shutil.which(tool_name)
+            candidate = _which(tool_name)
             if candidate:
                 return candidate
             # Check common paths (including Homebrew paths on macOS)
@@ -2001,7 +2769,7 @@ ZDTT Terminal v{self.version}
                 manual_hint = "sudo apt-get install neofetch"
             elif tool_name == 'neofetch' and self.is_mac:
                 # Use Homebrew on macOS
-                brew_path = shutil.which('brew')
+                brew_path = _which('brew')
                 if not brew_path:
                     # Check common Homebrew locations
                     for path in ('/opt/homebrew/bin/brew', '/usr/local/bin/brew'):
@@ -2014,11 +2782,9 @@ ZDTT Terminal v{self.version}
             else:
                 return None, manual_hint
 
-            geteuid = getattr(os, 'geteuid', None)
-            is_root = geteuid is not None and geteuid() == 0
-            sudo_path = shutil.which('sudo')
+            sudo_path = _which('sudo')
 
-            if is_root:
+            if self._is_root:
                 return base_cmd, manual_hint
             if sudo_path and not self.is_mac:  # macOS doesn't need sudo for brew
                 return [sudo_path] + base_cmd, manual_hint
@@ -2029,17 +2795,26 @@ ZDTT Terminal v{self.version}
             print("sysfetch currently supports Debian-based, Arch-based, or macOS systems only.")
             return
 
-        tool_bin = _find_tool_binary(tool_name)
+        tool_bin = self._sysfetch_bin
+        if tool_bin and not os.access(tool_bin, os.X_OK):
+            # Cached binary disappeared (e.g. uninstalled); search again
+            tool_bin = None
+        if not tool_bin:
+            tool_bin = _find_tool_binary(tool_name)
         if not tool_bin:
             install_cmd, manual_hint = _build_install_command(tool_name)
+            installed = False
             if install_cmd:
                 print(f"{tool_name} is not installed. Installing...")
                 print()
                 try:
-                    subprocess.run(install_cmd, check=True)
+                    # Our fds are non-inheritable anyway (PEP 446); skipping the
+                    # close_fds sweep lets subprocess use posix_spawn
+                    subprocess.run(install_cmd, check=True, close_fds=False)
                     print()
                     print(f"{tool_name} installed successfully!")
                     print()
+                    installed = True
                 except subprocess.CalledProcessError:
                     print(f"Failed to install {tool_name}")
                     if manual_hint:
@@ -2048,29 +2823,36 @@ ZDTT Terminal v{self.version}
                         print("Please install the tool via your package manager.")
             elif manual_hint:
                 print(manual_hint)
-            tool_bin = _find_tool_binary(tool_name)
+            # apt-get and pacman install into /usr/bin, so one check usually
+            # finds the new binary without another PATH walk
+            packaged_bin = f"/usr/bin/{tool_name}"
+            if installed and os.access(packaged_bin, os.X_OK):
+                tool_bin = packaged_bin
+            else:
+                tool_bin = _find_tool_binary(tool_name)
 
         if not tool_bin:
             print(f"Unable to run {tool_name}. Install it manually and rerun sysfetch.")
             return
+        self._sysfetch_bin = tool_bin
 
-        subprocess.run([tool_bin] + args)
+        self._spawn_wait([tool_bin] + args)
         print(f"\n(sysfetch used {tool_name})\n")
     
     # Python Commands
     
     def cmd_python(self, args):
         """Run python command"""
-        subprocess.run(['python'] + args)
+        self._spawn_wait(['python'] + args)
     
     def cmd_python3(self, args):
         """Run python3 command"""
-        subprocess.run(['python3'] + args)
+        self._spawn_wait(['python3'] + args)
 
     def cmd_pip(self, args):
         """Run pip command"""
-        if shutil.which('pip'):
-            subprocess.run(['pip'] + args)
+        if _which('pip'):
+            self._spawn_wait(['pip'] + args)
         else:
             print("pip: command not found")
             if self.is_mac:
@@ -2082,8 +2864,8 @@ ZDTT Terminal v{self.version}
     
     def cmd_pip3(self, args):
         """Run pip3 command"""
-        if shutil.which('pip3'):
-            subprocess.run(['pip3'] + args)
+        if _which('pip3'):
+            self._spawn_wait(['pip3'] + args)
         else:
             print("pip3: command not found")
             if self.is_mac:
@@ -2095,26 +2877,65 @@ ZDTT Terminal v{self.version}
 
     def cmd_update(self, args):
         """Trigger the external updater shipping with ZDTT."""
-        zdtt_wrapper = shutil.which('zdtt')
-        installer_script = os.path.join(
-            os.path.expanduser("~/.local/share/zdtt"),
-            'install.sh'
-        )
-
         # Add --auto flag to enable auto-update (skip prompt)
         update_args = ['update', '--auto'] + args
 
+        # The wrapper lookup is memoized; the installer path is only built
+        # (from the home directory resolved at startup) when it's needed
+        zdtt_wrapper = _which('zdtt')
         if zdtt_wrapper:
-            subprocess.run([zdtt_wrapper] + update_args)
+            self._spawn_wait([zdtt_wrapper] + update_args)
             return
 
+        installer_script = os.path.join(self._home, '.local', 'share', 'zdtt', 'install.sh')
         if os.path.isfile(installer_script):
-            subprocess.run(['bash', installer_script] + update_args)
+            self._spawn_wait(['bash', installer_script] + update_args)
             return
 
         print("Unable to locate the ZDTT updater.")
         print("Re-run the installer script or use 'zdtt update' from your shell if available.")
     
+    def _spawn_wait(self, argv):
+        """Run a foreground command via posix_spawn and wait for it to exit."""
+        try:
+            if not hasattr(os, 'posix_spawnp'):
+                subprocess.run(argv, close_fds=False)
+                return
+            
+            # posix_spawn avoids duplicating this (large) process with fork();
+            # the child inherits stdin/stdout/stderr and the current directory.
+            # The path comes from the memoized PATH lookup, so the PATH walk
+            # only happens on the first run; argv[0] keeps the plain name.
+            # Python ignores SIGPIPE and SIGXFSZ; put them back to the default
+            # for the child, as subprocess does with restore_signals=True
+            sigdef = (signal.SIGPIPE, signal.SIGXFSZ)
+            path = _which(argv[0])
+            try:
+                if not path:
+                    raise FileNotFoundError
+                pid = os.posix_spawn(path, argv, os.environ, setsigdef=sigdef)
+            except FileNotFoundError:
+                # The cached binary may have been removed or moved since
+                _forget_which(argv[0])
+                pid = os.posix_spawnp(argv[0], argv, os.environ, setsigdef=sigdef)
+        except FileNotFoundError:
+            print(f"{argv[0]}: command not found")
+            return
+        except OSError as e:
+            print(f"{argv[0]}: {e.strerror or e}")
+            return
+        
+        try:
+            os.waitpid(pid, 0)
+        except KeyboardInterrupt:
+            # Like subprocess.run, don't leave the child behind on Ctrl+C
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+            raise
+    
     def _is_dangerous_command(self, command):
         """Check if a command is dangerous and should be blocked."""
         if not command or not command.strip():
@@ -2178,65 +2999,77 @@ ZDTT Terminal v{self.version}
             print(f"{self.COLOR_DIM}If you really need to run this command, use your system shell directly.{self.COLOR_RESET}")
             return
         
-        # Temporarily disable status bar updates during command execution
-        status_bar_was_running = self.status_bar_thread and self.status_bar_thread.is_alive()
+        hide_output = False
+        
+        # Plain "prog arg ..." lines skip /bin/sh, saving a process per command
+        argv = None
+        if SHELL_META_CHARS.isdisjoint(command):
+            argv = command.split()
+            if not argv or '=' in argv[0]:
+                argv = None  # Empty, or a VAR=value assignment for the shell
         
         try:
-            # Start the process with direct stdin/stdout/stderr
-            process = subprocess.Popen(
-                command,
-                shell=True,
+            popen_kwargs = dict(
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,  # Merge stderr into stdout
                 stdin=sys.stdin,  # Direct stdin passthrough
-                bufsize=1,  # Line buffered
-                text=True,
+                bufsize=0,  # Unbuffered, the pipe fd is read directly
                 cwd=self.current_dir
             )
+            process = None
+            if argv is not None:
+                try:
+                    process = subprocess.Popen(argv, **popen_kwargs)
+                except OSError as e:
+                    # Shell builtins, commands that really are missing, or
+                    # scripts without a #! line (ENOEXEC) that sh runs itself:
+                    # let the shell run them or print its usual error
+                    if e.errno not in (errno.ENOENT, errno.EACCES, errno.ENOEXEC):
+                        raise
+                    process = None
+            if process is None:
+                process = subprocess.Popen(command, shell=True, **popen_kwargs)
+            
+            stdout_fd = process.stdout.fileno()
+            out = sys.stdout.buffer
             
-            # Buffer for early output detection
-            early_output = []
+            # Tail of the previous chunk, so a message split across reads still matches
+            early_tail = b''
             start_time = time_module.time()
             check_timeout = 0.1  # 0.1 seconds
-            hide_output = False
-            output_buffer = []
             
             # Read output in real-time
             try:
+                sys.stdout.flush()
+                # Ttys don't accept splice on current kernels; don't spend a
+                # failing syscall finding that out on every command
+                use_splice = hasattr(os, 'splice') and not sys.stdout.isatty()
                 while True:
-                    # Read character by character for early detection
-                    char = process.stdout.read(1)
-                    if not char:
-                        if process.poll() is not None:
+                    if use_splice and time_module.time() - start_time >= check_timeout:
+                        # Sniff window is over, let the kernel move the rest
+                        if _splice_all(stdout_fd, sys.stdout.fileno()):
                             break
-                        time_module.sleep(0.01)
-                        continue
+                        use_splice = False
+                    
+                    # Take whatever the pipe holds (up to 64 KiB) in one syscall
+                    chunk = os.read(stdout_fd, 65536)
+                    if not chunk:
+                        break
                     
                     # Check for "command not found" in first 0.1 seconds
                     if time_module.time() - start_time < check_timeout:
-                        early_output.append(char)
-                        combined = ''.join(early_output).lower()
-                        if 'command not found' in combined or 'not found:' in combined:
+                        if COMMAND_NOT_FOUND_RE.search(early_tail + chunk):
                             hide_output = True
                             # Consume remaining output silently
-                            while process.poll() is None:
-                                process.stdout.read(1)
+                            while os.read(stdout_fd, 65536):
+                                pass
                             break
+                        early_tail = (early_tail + chunk)[-16:]
                     
-                    # Buffer output
-                    output_buffer.append(char)
-                    
-                    # If we have a complete line or enough chars, flush
-                    if char == '\n' or len(output_buffer) >= 1024:
-                        if not hide_output:
-                            sys.stdout.write(''.join(output_buffer))
-                            sys.stdout.flush()
-                        output_buffer.clear()
-                
-                # Flush remaining buffer
-                if output_buffer and not hide_output:
-                    sys.stdout.write(''.join(output_buffer))
-                    sys.stdout.flush()
+                    # Pass bytes straight through; flushing per chunk keeps
+                    # prompts without a trailing newline visible
+                    out.write(chunk)
+                    out.flush()
                 
                 # Wait for process to finish
                 process.wait()
@@ -2261,10 +3094,6 @@ ZDTT Terminal v{self.version}
         except Exception as e:
             if not hide_output:
                 print(f"{self.COLOR_ERROR}Error executing command: {e}{self.COLOR_RESET}")
-        finally:
-            # Restore status bar if it was running
-            if status_bar_was_running:
-                self._render_status_bar()
 
     def execute_command(self, command_line):
         """Parse and execute a command"""
@@ -2297,18 +3126,29 @@ ZDTT Terminal v{self.version}
                 print("No command specified with -oszdtt flag")
             return
         
-        try:
-            parts = shlex.split(command_line)
-        except ValueError as exc:
-            print(f"parse error: {exc}")
-            return
+        if SHLEX_SPECIAL_CHARS.isdisjoint(command_line):
+            # Nothing to unquote, so a C-level whitespace split gives the same argv
+            parts = command_line.split()
+        else:
+            import shlex
+            try:
+                parts = shlex.split(command_line)
+            except ValueError as exc:
+                print(f"parse error: {exc}")
+                return
 
         if not parts:
             return
 
-        cmd = parts[0].lower()
+        first = parts[0]
+        # Commands are keyed in lowercase; most input already is, so skip the copy
+        cmd = sys.intern(first if first.islower() else first.lower())
         args = parts[1:] if len(parts) > 1 else []
         
+        if self._plugin_thread is not None:
+            # Register plugins that are ready; only wait for them when the
+            # command is unknown, since it might be one they provide
+            self._finish_plugin_loading(wait=cmd not in self.commands)
         if cmd in self.commands:
             self.commands[cmd](args)
         else:
@@ -2326,30 +3166,36 @@ ZDTT Terminal v{self.version}
                 pass
         
         # Clear screen and display banner
-        os.system('clear' if os.name != 'nt' else 'cls')
+        self._clear_screen()
         self.initialize_status_bar()
         self.display_banner()
         
-        # Display security warnings for quarantined plugins (if any)
-        if self.quarantine_warnings:
-            print()
-            for warning in self.quarantine_warnings:
-                print(warning)
-            print()
-        
         # Main command loop
         try:
             while self.running:
                 try:
-                    command = input(self.get_prompt())
+                    # Plugins still preparing don't hold up the prompt; they are
+                    # registered (with any trust prompts) here once ready, or by
+                    # execute_command if an unknown command arrives first
+                    self._finish_plugin_loading(wait=False)
+                    self._at_prompt = True
+                    try:
+                        command = input(self.get_prompt())
+                    finally:
+                        self._at_prompt = False
                     self.execute_command(command)
                 except KeyboardInterrupt:
                     print("\nUse 'exit' to return to shell, or 'quit' to close the window.")
                 except EOFError:
                     print("\nGoodbye!")
                     break
+                # The timer skips redraws while a command runs, and full-screen
+                # programs (nano, less) may have drawn over row 1
+                if self.running and self.status_bar_active:
+                    self._render_status_bar()
         finally:
             self.shutdown_status_bar()
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
 
 
 def main():
@@ -2359,8 +3205,7 @@ def main():
     # Check system compatibility
     distro = check_system_compatibility()
     
-    terminal = ZDTTTerminal(distro=distro)
-    terminal.safe_mode = safe_mode
+    terminal = ZDTTTerminal(distro=distro, safe_mode=safe_mode)
     
     if safe_mode:
         print(f"{terminal.COLOR_WARNING}⚠ Safe mode enabled - plugins will not be loaded{terminal.COLOR_RESET}")